@@ -0,0 +1,73 @@
+"""Where-to-go map size and build time, detailed vs scalable rendering.
+
+For growing numbers of synthetic destinations, reports the server-side build
+and render time, the HTML shipped to the browser and the number of Leaflet
+layer constructor calls in that HTML. In the detailed rendering there is one
+per element, each a DOM/SVG node, which is what makes the browser crawl. In
+the scalable one it is a constant: markers go into the cluster and badges are
+only created when zoomed in. Then times the great-circle flight paths for the
+largest count, computed from scratch and served from an ``ArcCache``. Run
+from the repository root:
+
+    python benchmarks/bench_destination_map.py [count ...]
+"""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from destination_map import ROUTE_ZOOM, build_destination_map
+from geo import ArcCache
+from destination_scoring import index_colors
+from records import Destination
+
+ORIGIN = {"Lat": 12.9716, "Lon": 77.5946, "City": "Bangalore (India)"}
+COUNTRIES = ["Italy", "France", "Thailand", "Cambodia", "Egypt"]
+LAYER_CALLS = re.compile(r"\bL\.(?:marker|circle|circleMarker|polyline(?:\.antPath)?|geoJson)\(")
+
+
+def synthetic_destinations(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        Destination(f"Destination {i}", rng.uniform(-40, 60), rng.uniform(-20, 140), rng.choice(COUNTRIES),
+                    rng.choice(["Yes", "No", "E-visa/VoA"]), "~5-10 working days", 10, "$100/day",
+                    "Synthetic destination", rng.randrange(3000, 30000, 500), rng.randint(10, 90), "star")
+        for i in range(count)
+    ]
+
+
+def measure(destinations, scalable):
+    badges = [random.randint(20, 90) for _ in destinations]
+    colors, shades = index_colors(badges, 20, 90), index_colors([b - 5 for b in badges], 20, 90)
+    start = time.perf_counter()
+    html = build_destination_map(destinations, ORIGIN, badges, colors, shades, scalable=scalable).get_root().render()
+    return (time.perf_counter() - start) * 1000, len(html.encode("utf-8")) / 1024, len(LAYER_CALLS.findall(html))
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [5, 50, 200, 500]
+    measure(synthetic_destinations(1), False)  # import folium outside the timings
+    print(f"{'destinations':>12}  {'mode':<9}{'build ms':>10}{'HTML KB':>10}{'Leaflet calls':>15}")
+    for count in counts:
+        destinations = synthetic_destinations(count)
+        for scalable in (False, True):
+            build_ms, size_kb, layers = measure(destinations, scalable)
+            mode = "scalable" if scalable else "detailed"
+            print(f"{count:>12}  {mode:<9}{build_ms:>10.0f}{size_kb:>10.0f}{layers:>15}")
+
+    lats = [loc.lat for loc in destinations]
+    lons = [loc.lon for loc in destinations]
+    arcs = ArcCache()
+    for label in ("computed", "cached"):
+        start = time.perf_counter()
+        routes = arcs.arcs((ORIGIN["Lat"], ORIGIN["Lon"]), lats, lons, ROUTE_ZOOM)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        points = sum(len(route) for route in routes) / len(routes)
+        print(f"{count:,} great-circle paths {label} in {elapsed_ms:.1f} ms ({points:.1f} points per path)")
+
+
+if __name__ == "__main__":
+    main()
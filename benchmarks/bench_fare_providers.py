@@ -0,0 +1,70 @@
+"""Throughput and tail latency of FareService against mock providers.
+
+Many concurrent "sessions" (threads) search a small set of routes. The
+report shows how many upstream calls were made (coalescing and the TTL cache
+should keep this at one per provider and query) and the per-search latency
+distribution.
+
+Run from the repository root:
+
+    python benchmarks/bench_fare_providers.py [sessions] [searches_per_session] [latency_s]
+"""
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fare_providers import FareService, MockFareProvider, fare_query
+
+ROUTES = [("BLR", "CDG"), ("BLR", "BKK"), ("BLR", "DXB"), ("BLR", "SIN")]
+PROVIDERS = 3
+
+
+def percentile(samples, q):
+    return statistics.quantiles(samples, n=100)[q - 1] if len(samples) > 1 else samples[0]
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    searches = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.2
+
+    providers = [MockFareProvider(f"mock-{i}", size=500, latency=latency, jitter=latency / 2) for i in range(PROVIDERS)]
+    service = FareService(providers, ttl=60)
+    queries = [fare_query(*route, "2025-04-03", "2025-04-16") for route in ROUTES]
+    latencies = []
+    lock = threading.Lock()
+
+    def session(n):
+        timings = []
+        for i in range(searches):
+            start = time.perf_counter()
+            service.search(queries[(n + i) % len(queries)])
+            timings.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(timings)
+
+    threads = [threading.Thread(target=session, args=(n,)) for n in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    service.close()
+
+    upstream = sum(provider.calls for provider in providers)
+    total = len(latencies)
+    print(f"{sessions} sessions x {searches} searches over {len(queries)} routes, "
+          f"{PROVIDERS} providers at {latency * 1000:.0f} ms (+ jitter)")
+    print(f"  {total:,} searches in {elapsed:.2f} s ({total / elapsed:,.0f}/s), "
+          f"{upstream} upstream calls (ideal {PROVIDERS * len(queries)})")
+    print(f"  latency p50 {percentile(latencies, 50) * 1000:.2f} ms, p95 {percentile(latencies, 95) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.2f} ms, max {max(latencies) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Flight search and recommendation latency over a large synthetic set of itineraries.
+
+Run from the repository root:
+
+    python benchmarks/bench_flight_search.py [itineraries]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fare_providers import MOCK_CARRIERS as CARRIERS, synthetic_flights
+from flight_recommender import TRAVELLER_WEIGHTS, recommend
+from flight_search import SORT_FIELDS, FlightIndex
+from records import Flight
+
+QUERIES = 100
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    flights = [Flight.from_dict(flight) for flight in synthetic_flights(size)]
+
+    start = time.perf_counter()
+    index = FlightIndex(flights)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    cases = [
+        ("no filters, by price", {}),
+        ("price + duration + 06:00-12:00 + 3 carriers + low delay, by duration",
+         {"max_price": 90_000, "max_duration": 900, "departure_window": (360, 720),
+          "carriers": CARRIERS[:3], "max_delay": "Low", "sort_by": "Duration"}),
+        ("no filters, by departure, page 50", {"sort_by": "Departure time", "offset": 500}),
+    ]
+    for label, query in cases:
+        start = time.perf_counter()
+        for _ in range(QUERIES):
+            _, total = index.search(limit=10, **query)
+        query_ms = (time.perf_counter() - start) / QUERIES * 1000
+        print(f"{size:,} itineraries, {label}: {query_ms:.2f} ms ({total:,} matches)")
+    for sort_by in SORT_FIELDS:
+        start = time.perf_counter()
+        index.search(sort_by=sort_by, descending=True)
+        print(f"  sort by {sort_by} (desc): {(time.perf_counter() - start) * 1000:.2f} ms")
+    for candidates in (1_000, 10_000, size):
+        matches = index.matching()[:candidates]
+        for traveller in TRAVELLER_WEIGHTS:
+            start = time.perf_counter()
+            recommend(index, matches, traveller)
+            print(f"  recommend over {len(matches):,} candidates ({traveller}): "
+                  f"{(time.perf_counter() - start) * 1000:.2f} ms")
+    print(f"index built once in {build_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
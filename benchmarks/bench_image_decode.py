@@ -0,0 +1,60 @@
+"""Per-rerun photo decode time: original JPEG + LANCZOS resize vs cached derivative.
+
+Run from the repository root:
+
+    python benchmarks/bench_image_decode.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image
+
+import image_cache
+
+IMAGES_PATH = Path("images")
+RERUNS = 20
+
+
+def decode_original(path, max_width=1200):
+    """What every rerun used to do before the derivative cache."""
+    img = Image.open(path)
+    if img.width > max_width:
+        new_height = int((max_width / img.width) * img.height)
+        img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
+    img.load()
+    return img
+
+
+def time_per_call(fn, path, reruns=RERUNS):
+    start = time.perf_counter()
+    for _ in range(reruns):
+        fn(path)
+    return (time.perf_counter() - start) / reruns * 1000
+
+
+def main():
+    photos = sorted(p for p in IMAGES_PATH.iterdir() if p.suffix.lower() in (".jpg", ".jpeg"))
+    print(f"{'photo':<12}{'size KB':>10}{'before ms':>12}{'cold build ms':>15}{'after ms':>12}")
+    totals = [0.0, 0.0]
+    for path in photos:
+        before = time_per_call(decode_original, path)
+
+        for cached in image_cache.build_derivatives(path).values():
+            cached.unlink()
+        image_cache._load_derivative.cache_clear()
+        start = time.perf_counter()
+        image_cache.load_display_image(path)
+        cold = (time.perf_counter() - start) * 1000
+
+        after = time_per_call(image_cache.load_display_image, path)
+        totals[0] += before
+        totals[1] += after
+        print(f"{path.name:<12}{path.stat().st_size / 1024:>10.0f}{before:>12.2f}{cold:>15.2f}{after:>12.4f}")
+    print(f"{'total':<12}{'':>10}{totals[0]:>12.2f}{'':>15}{totals[1]:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
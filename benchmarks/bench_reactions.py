@@ -0,0 +1,75 @@
+"""Reaction throughput: one store write per click vs the write-behind buffer.
+
+Simulates many concurrent sessions clicking reactions on a shared feed and
+reports reactions per second for both paths. Run from the repository root:
+
+    python benchmarks/bench_reactions.py [sessions] [clicks_per_session]
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from post_store import COUNTER_FIELDS, SQLitePostStore
+from reactions import ReactionBuffer
+
+POSTS = 50
+
+
+def make_store(directory, name):
+    store = SQLitePostStore(os.path.join(directory, name))
+    post_ids = [store.add_post("Paris", "bench", f"post {i}", "gem") for i in range(POSTS)]
+    return store, post_ids
+
+
+def run_sessions(click, post_ids, sessions, clicks):
+    def session(seed):
+        rng = random.Random(seed)
+        for _ in range(clicks):
+            click(rng.choice(post_ids), rng.choice(COUNTER_FIELDS))
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def total_count(store, post_ids):
+    return sum(sum(store.get_counts(post_id).values()) for post_id in post_ids)
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    clicks = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    expected = sessions * clicks
+
+    with tempfile.TemporaryDirectory() as directory:
+        store, post_ids = make_store(directory, "direct.db")
+        elapsed = run_sessions(store.increment, post_ids, sessions, clicks)
+        assert total_count(store, post_ids) == expected
+        print(f"direct writes:  {expected / elapsed:>12,.0f} reactions/s ({elapsed:.2f}s)")
+        store.close()
+
+        store, post_ids = make_store(directory, "buffered.db")
+        buffer = ReactionBuffer(store)
+        elapsed = run_sessions(buffer.record, post_ids, sessions, clicks)
+        start = time.perf_counter()
+        buffer.close()
+        drain = time.perf_counter() - start
+        assert total_count(store, post_ids) == expected
+        print(f"write-behind:   {expected / elapsed:>12,.0f} reactions/s ({elapsed:.2f}s, final flush {drain * 1000:.1f} ms)")
+        store.close()
+
+    print(f"{sessions} sessions x {clicks} clicks over {POSTS} posts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Top-k nearest-restaurant latency for large synthetic catalogs.
+
+Run from the repository root:
+
+    python benchmarks/bench_recommender.py [restaurants]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from records import PRICE_LEVELS, Restaurant
+from restaurant_recommender import RestaurantIndex
+
+QUERIES = 200
+CUISINES = ["French", "Italian", "Middle Eastern", "Japanese", "Thai", "Indian"]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(0)
+    restaurants = {}
+    for i in range(size):
+        name = f"Restaurant {i}"
+        price = rng.choice(list(PRICE_LEVELS))
+        restaurants[name] = Restaurant(name, 48.85 + rng.uniform(-0.2, 0.2), 2.35 + rng.uniform(-0.3, 0.3),
+                                       rng.choice(CUISINES), price, rng.randint(1, 5), PRICE_LEVELS[price])
+
+    start = time.perf_counter()
+    index = RestaurantIndex(restaurants)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    anchors = [[(48.85 + rng.uniform(-0.1, 0.1), 2.35 + rng.uniform(-0.1, 0.1)) for _ in range(2)]
+               for _ in range(QUERIES)]
+    for label, filters in [("no filters", {}), ("French, <= €€, >= 4 stars",
+                                                {"cuisines": ["French"], "max_price": "€€", "min_stars": 4})]:
+        start = time.perf_counter()
+        for pair in anchors:
+            index.nearest(pair, k=5, **filters)
+        query_ms = (time.perf_counter() - start) / QUERIES * 1000
+        print(f"{size:,} restaurants, {label}: top-5 in {query_ms:.2f} ms")
+    print(f"index built once in {build_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
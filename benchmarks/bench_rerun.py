@@ -0,0 +1,340 @@
+"""Rerun latency and memory of every Streamlit entry point under realistic use.
+
+Each app is driven through ``AppTest`` in its own fresh interpreter, by a
+scenario that clicks what a user would click (swipes and photo navigation,
+reactions and comments, tab switches and restaurant picks, flight filters and
+paging, where-to-go weights). For each app the report gives the first (cold)
+run, p50/p95/max of the following reruns, the median size of the elements a
+rerun sends to the browser (their serialized protos, i.e. the websocket
+payload), the largest Python allocation peak of a single rerun
+(``tracemalloc``, measured in a separate pass so it does not skew timings)
+and the process's peak RSS.
+
+``--scale N`` swaps in large synthetic catalogs through the apps' own data
+settings: N posts per destination in a scratch community database, N extra
+restaurants per city catalog, N mock fares per flight search and N extra
+where-to-go destinations. The swipe pages keep their built-in cards.
+
+``--json PATH`` writes a machine-readable report; ``--compare OLD.json``
+prints the change against an earlier report. Run from the repository root:
+
+    python benchmarks/bench_rerun.py [--reruns N] [--scale N] [--json PATH] [--compare OLD.json] [app.py ...]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_RERUNS = 40
+TRACED_RERUNS = 10
+CUISINES = ["French", "Italian", "Middle Eastern", "Japanese", "Thai", "Indian"]
+POST_TYPES = ["gem", "scam", "experience"]
+
+
+# --- Scenarios: generators that set up one interaction and yield its label ---
+def find_button(at, prefix):
+    return next((b for b in at.button if b.label.startswith(prefix) and not b.disabled), None)
+
+
+def swipe_scenario(at):
+    swipes = 0
+    while True:
+        like = find_button(at, "❤️ Like")
+        if like is None:
+            # Swiped through every card: start over, as a new visitor would
+            at.session_state["indices"] = {city: 0 for city in at.session_state["indices"]}
+            at.session_state["liked"] = []
+            yield "restart"
+            continue
+        for prefix, label in [("Next Photo", "photo next"), ("⬅️ Prev Photo", "photo prev")]:
+            button = find_button(at, prefix)
+            if button is not None:
+                button.click()
+                yield label
+        swipes += 1
+        label = "like" if swipes % 2 else "skip"
+        find_button(at, "❤️ Like" if swipes % 2 else "❌ Skip").click()
+        yield label
+
+
+def community_scenario(at):
+    round_ = 0
+    while True:
+        round_ += 1
+        reactions = [b for b in at.button if b.key and b.key.startswith(("like_", "useful_", "notuseful_"))]
+        for button in reactions[:6]:
+            at.button(key=button.key).click()
+            yield "reaction"
+        post_id = reactions[0].key.rsplit("_", 1)[1]
+        at.button(key=f"comments_{post_id}").click()
+        yield "open comments"
+        at.text_input(key=f"comment_{post_id}").input(f"Benchmark comment {round_}")
+        yield "comment"
+        at.button(key=f"comments_{post_id}").click()
+        yield "close comments"
+        more = find_button(at, "Load more")
+        if more is not None and round_ % 2:
+            more.click()
+            yield "load more"
+        newer = find_button(at, "⬅️ Newer posts")
+        if newer is not None and not round_ % 2:
+            newer.click()
+            yield "newer posts"
+
+
+def itinerary_scenario(at):
+    tabs = ["📋 Itinerary", "🗺️ Map", "💾 Export"]
+    step = 0
+    while True:
+        step += 1
+        at.session_state["itinerary_tab"] = tabs[step % len(tabs)]
+        yield f"tab {tabs[step % len(tabs)].split()[-1].lower()}"
+        for radio in [r for r in at.radio if r.key and r.key.startswith("meal_")]:
+            radio.set_value(radio.options[step % len(radio.options)])
+            yield "pick restaurant"
+
+
+def flight_scenario(at):
+    rng = random.Random(0)
+    while True:
+        price = next(s for s in at.slider if s.label.startswith("Max price"))
+        low, high = price.min, price.max
+        price.set_value(rng.randrange(low + (high - low) // 2, high + 1, 1000) if high > low else high)
+        yield "filter"
+        sort = next(s for s in at.selectbox if s.label == "Sort by")
+        sort.set_value(rng.choice(sort.options))
+        yield "sort"
+        for _ in range(2):
+            button = find_button(at, "Next ➡️")
+            if button is None:
+                break
+            button.click()
+            yield "next page"
+
+
+def map_scenario(at):
+    rng = random.Random(0)
+    while True:
+        yield "rerun"
+        weight = rng.choice([s for s in at.slider if s.key and s.key.startswith("weight_")])
+        weight.set_value(round(rng.uniform(0, 1) * 20) / 20)
+        yield "reweight"
+
+
+SCENARIOS = {
+    "comm2.py": community_scenario,
+    "community.py": community_scenario,
+    "flightbooking.py": flight_scenario,
+    "flightbookingbkk.py": flight_scenario,
+    "iten.py": itinerary_scenario,
+    "itenbkk.py": itinerary_scenario,
+    "swipeattractions.py": swipe_scenario,
+    "swipeattractionsbkk.py": swipe_scenario,
+    "wheretogo.py": map_scenario,
+}
+
+
+# --- Worker: runs one app in this (fresh) interpreter ---
+def payload_bytes(node):
+    """Serialized size of the elements under an AppTest tree node."""
+    children = getattr(node, "children", None)
+    if children:
+        return sum(payload_bytes(child) for child in children.values())
+    proto = getattr(node, "proto", None)
+    return proto.ByteSize() if hasattr(proto, "ByteSize") else 0
+
+
+def drive(app, reruns, traced=False):
+    """``(first run seconds, {label: [seconds]}, [payload bytes], largest rerun allocation peak in bytes)``."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / app), default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"first run: {at.exception[0].message}")
+
+    timings = defaultdict(list)
+    payloads = []
+    peak = 0
+    steps = SCENARIOS[app](at)
+    for _ in range(reruns):
+        label = next(steps)
+        if traced:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        at.run()
+        timings[label].append(time.perf_counter() - start)
+        if traced:
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+        if at.exception:
+            raise RuntimeError(f"{label}: {at.exception[0].message}")
+        payloads.append(payload_bytes(at._tree))
+    return first, timings, payloads, peak
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1] if len(values) > 1 else values[0]
+
+
+def worker(app, reruns):
+    first, timings, payloads, _ = drive(app, reruns)
+    tracemalloc.start()
+    _, _, _, peak = drive(app, min(reruns, TRACED_RERUNS), traced=True)
+    tracemalloc.stop()
+
+    samples = [t for values in timings.values() for t in values]
+    return {
+        "app": app,
+        "first_run_ms": first * 1000,
+        "reruns": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "max_ms": max(samples) * 1000,
+        "payload_kb": statistics.median(payloads) / 1024,
+        "steps": {label: {"count": len(values), "p50_ms": percentile(values, 50) * 1000}
+                  for label, values in sorted(timings.items())},
+        "peak_rerun_alloc_mb": peak / 2**20,
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2**20 if sys.platform == "darwin" else 2**10),
+    }
+
+
+# --- Synthetic data ---
+def write_cities(directory, scale):
+    """Every real city catalog plus ``scale`` synthetic restaurants around its center."""
+    rng = random.Random(0)
+    for path in (ROOT / "cities").glob("*.json"):
+        catalog = json.loads(path.read_text(encoding="utf-8"))
+        lat, lon = catalog["center"]
+        for i in range(scale):
+            catalog["restaurants"][f"Synthetic Restaurant {i}"] = {
+                "lat": lat + rng.uniform(-0.1, 0.1), "lon": lon + rng.uniform(-0.15, 0.15),
+                "cuisine": rng.choice(CUISINES), "price": rng.choice(["€", "€€", "€€€"]), "stars": rng.randint(1, 5),
+            }
+        (Path(directory) / path.name).write_text(json.dumps(catalog, ensure_ascii=False), encoding="utf-8")
+
+
+def write_posts(path, scale):
+    from post_store import SQLitePostStore
+
+    rng = random.Random(0)
+    store = SQLitePostStore(path)
+    now = time.time()
+    for destination in ["Paris", "Bangkok"]:
+        for i in range(scale):
+            store.add_post(destination, rng.choice(["Alice", "Bob", "Clara", "David", "Eva", "Frank"]),
+                           f"Synthetic {destination} tip #{i}", rng.choice(POST_TYPES),
+                           likes=rng.randint(0, 50), useful=rng.randint(0, 30), not_useful=rng.randint(0, 5),
+                           created_at=now - i * 60)
+    store.close()
+
+
+def scenario_env(directory, scale):
+    """Environment pointing the apps at scratch data, synthetic when ``scale`` > 0."""
+    env = dict(os.environ)
+    env["SWIPESCAPES_COMMUNITY_DB"] = os.path.join(directory, "community.db")
+    env["SWIPESCAPES_IMAGE_CACHE"] = os.path.join(directory, "image_cache")
+    if scale:
+        cities_dir = os.path.join(directory, "cities")
+        os.mkdir(cities_dir)
+        write_cities(cities_dir, scale)
+        write_posts(env["SWIPESCAPES_COMMUNITY_DB"], scale)
+        env.update({
+            "SWIPESCAPES_CITIES_DIR": cities_dir,
+            "SWIPESCAPES_MOCK_FARES": str(scale),
+            "SWIPESCAPES_MOCK_LATENCY": "0",
+            "SWIPESCAPES_MOCK_DESTINATIONS": str(scale),
+        })
+    return env
+
+
+# --- Report ---
+def measure(app, reruns, scale):
+    with tempfile.TemporaryDirectory() as directory:
+        result = subprocess.run([sys.executable, __file__, "--worker", app, "--reruns", str(reruns)],
+                                cwd=ROOT, env=scenario_env(directory, scale), capture_output=True, text=True)
+    if result.returncode:
+        return {"app": app, "error": (result.stderr.strip().splitlines() or ["worker failed"])[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def git_revision():
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def print_report(report, baseline=None):
+    previous = {r["app"]: r for r in baseline["apps"]} if baseline else {}
+    print(f"revision {report['revision']}, scale {report['scale']:,}, {report['reruns']} reruns per app")
+    print(f"{'app':<24}{'first ms':>9}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}{'sent KB':>9}{'alloc MB':>10}{'rss MB':>8}")
+    for r in report["apps"]:
+        if "error" in r:
+            print(f"{r['app']:<24}  ERROR: {r['error']}")
+            continue
+        print(f"{r['app']:<24}{r['first_run_ms']:>9.0f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['max_ms']:>9.1f}"
+              f"{r.get('payload_kb', float('nan')):>9.1f}{r['peak_rerun_alloc_mb']:>10.1f}{r['max_rss_mb']:>8.0f}")
+        old = previous.get(r["app"])
+        if old and "error" not in old:
+            label = f"  vs {baseline['revision']}"
+            print(f"{label:<24}{'':>9}{r['p50_ms'] / old['p50_ms'] - 1:>+9.0%}"
+                  f"{r['p95_ms'] / old['p95_ms'] - 1:>+9.0%}{'':>9}"
+                  f"{r['payload_kb'] - old.get('payload_kb', r['payload_kb']):>+9.1f}"
+                  f"{r['peak_rerun_alloc_mb'] - old['peak_rerun_alloc_mb']:>+10.1f}{r['max_rss_mb'] - old['max_rss_mb']:>+8.0f}")
+        steps = ", ".join(f"{label} {s['p50_ms']:.0f}" for label, s in r["steps"].items())
+        print(f"{'':<24}p50 by step (ms): {steps}")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("apps", nargs="*", default=list(SCENARIOS))
+    parser.add_argument("--reruns", type=int, default=DEFAULT_RERUNS)
+    parser.add_argument("--scale", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH")
+    parser.add_argument("--compare", metavar="OLD.json")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.reruns)))
+        return 0
+
+    import streamlit
+
+    report = {
+        "revision": git_revision(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "scale": args.scale,
+        "reruns": args.reruns,
+        "apps": [measure(app, args.reruns, args.scale) for app in args.apps],
+    }
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if any("error" in r for r in report["apps"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
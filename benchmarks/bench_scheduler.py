@@ -0,0 +1,64 @@
+"""Rescheduling cost of a multi-day itinerary with the travel-time model.
+
+Run from the repository root:
+
+    python benchmarks/bench_scheduler.py [places] [days] [stops_per_day]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from itinerary_scheduler import TravelModel
+from records import Attraction, Restaurant
+
+REPEATS = 50
+
+
+def synthetic_catalog(places, rng):
+    attractions = {}
+    for i in range(places):
+        name = f"Attraction {i}"
+        attractions[name] = Attraction(name, 48.85 + rng.uniform(-0.1, 0.1), 2.35 + rng.uniform(-0.15, 0.15),
+                                       rng.choice([45, 60, 90, 120]), "Iconic")
+    restaurants = {}
+    for i in range(places // 4):
+        name = f"Restaurant {i}"
+        restaurants[name] = Restaurant(name, 48.85 + rng.uniform(-0.1, 0.1), 2.35 + rng.uniform(-0.15, 0.15),
+                                       "French", "€€", 4, 2)
+    return attractions, restaurants
+
+
+def main():
+    places = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 14
+    stops_per_day = int(sys.argv[3]) if len(sys.argv) > 3 else 40
+    rng = random.Random(0)
+    attractions, restaurants = synthetic_catalog(places, rng)
+
+    start = time.perf_counter()
+    model = TravelModel(attractions, restaurants)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    names = list(attractions) + list(restaurants)
+    itinerary = {
+        f"Day {d + 1}": {"start": "09:00", "stops": [
+            {"name": name, "type": "restaurant" if name in restaurants else "attraction"}
+            for name in rng.sample(names, stops_per_day)
+        ]}
+        for d in range(days)
+    }
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        model.schedule_itinerary(itinerary)
+    schedule_ms = (time.perf_counter() - start) / REPEATS * 1000
+
+    print(f"catalog: {len(names)} places, matrix built once in {build_ms:.1f} ms")
+    print(f"plan: {days} days x {stops_per_day} stops rescheduled in {schedule_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
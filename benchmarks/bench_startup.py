@@ -0,0 +1,96 @@
+"""Cold-start cost of every Streamlit entry point.
+
+Each app is measured in fresh interpreters, so nothing is shared between
+apps or warmed up by an earlier measurement:
+
+* import   - time to run the script's top-level import statements
+  (``streamlit`` itself is imported beforehand and not counted);
+* render   - time of the first ``AppTest`` run of the whole script,
+  including those imports;
+* heavy    - which heavy optional dependencies are loaded after that
+  first run.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py [--json] [app.py ...]
+"""
+import ast
+import json
+import subprocess
+import sys
+
+APPS = [
+    "comm2.py",
+    "community.py",
+    "flightbooking.py",
+    "flightbookingbkk.py",
+    "iten.py",
+    "itenbkk.py",
+    "swipeattractions.py",
+    "swipeattractionsbkk.py",
+    "wheretogo.py",
+]
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "folium", "streamlit_folium", "PIL", "openpyxl"]
+
+IMPORT_PROBE = """
+import json, sys, time
+import streamlit
+source = sys.stdin.read()
+start = time.perf_counter()
+exec(compile(source, "imports", "exec"), {})
+print(json.dumps({"import_ms": (time.perf_counter() - start) * 1000}))
+"""
+
+RENDER_PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+app, heavy = sys.argv[1], sys.argv[2].split(",")
+at = AppTest.from_file(app, default_timeout=120)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "render_ms": elapsed * 1000,
+    "error": at.exception[0].message if at.exception else None,
+    "heavy": [name for name in heavy if name in sys.modules],
+}))
+"""
+
+
+def top_level_imports(app):
+    """Source of the script's module-level import statements, in order."""
+    with open(app, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def run_probe(args, stdin=None):
+    result = subprocess.run([sys.executable, "-c", *args], input=stdin, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(app):
+    report = {"app": app}
+    report.update(run_probe([IMPORT_PROBE], stdin=top_level_imports(app)))
+    report.update(run_probe([RENDER_PROBE, app, ",".join(HEAVY_MODULES)]))
+    return report
+
+
+def main(argv):
+    as_json = "--json" in argv
+    apps = [arg for arg in argv if arg != "--json"] or APPS
+    reports = [measure(app) for app in apps]
+
+    if as_json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print(f"{'app':<24}{'import ms':>10}{'render ms':>11}  heavy modules after first render")
+        for r in reports:
+            heavy = ", ".join(r["heavy"]) or "-"
+            status = f"  ERROR: {r['error']}" if r["error"] else ""
+            print(f"{r['app']:<24}{r['import_ms']:>10.0f}{r['render_ms']:>11.0f}  {heavy}{status}")
+    return 1 if any(r["error"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
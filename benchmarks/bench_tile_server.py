@@ -0,0 +1,135 @@
+"""Tile fetch latency: the local MBTiles server against the public providers.
+
+Fetches the same XYZ tiles (a few zoom levels around Paris) from each source
+over one keep-alive connection, as a browser would, and reports per-tile
+latency. The local server is measured cold (read from the bundle), warm
+(served from its in-memory cache) and revalidated (``If-None-Match`` answered
+with 304). Without ``--bundle`` a synthetic bundle of plain PNG tiles is
+generated; remote sources that can't be reached are reported as such. Run
+from the repository root:
+
+    python benchmarks/bench_tile_server.py [--bundle osm.mbtiles] [--zooms 10 11 12 13]
+"""
+import argparse
+import http.client
+import io
+import math
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from destination_map import TILES as LIGHT_GRAY_TILES
+from tile_server import MBTiles, TileCache, make_server
+
+CENTER = (48.8566, 2.3522)  # Paris
+REMOTE = {
+    "openstreetmap": "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
+    "arcgis light gray": LIGHT_GRAY_TILES,
+}
+USER_AGENT = "swipescapes-tile-benchmark/1.0"
+
+
+def tiles_around(center, zooms, radius=2):
+    """XYZ coordinates of a ``(2 * radius + 1)``-square of tiles around ``center`` per zoom."""
+    lat, lon = map(math.radians, center)
+    coords = []
+    for z in zooms:
+        n = 1 << z
+        cx = int((lon + math.pi) / (2 * math.pi) * n)
+        cy = int((1 - math.asinh(math.tan(lat)) / math.pi) / 2 * n)
+        coords += [(z, x % n, y) for x in range(cx - radius, cx + radius + 1)
+                   for y in range(max(cy - radius, 0), min(cy + radius + 1, n))]
+    return coords
+
+
+def synthetic_bundle(path, coords):
+    """MBTiles file with one small PNG per tile in ``coords``."""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (256, 256), (236, 236, 230)).save(buffer, "PNG")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+    conn.execute("CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)")
+    conn.execute("CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)")
+    conn.executemany("INSERT INTO metadata VALUES (?, ?)", [("name", "synthetic"), ("format", "png")])
+    conn.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)",
+                     [(z, x, (1 << z) - 1 - y, buffer.getvalue()) for z, x, y in coords])
+    conn.commit()
+    conn.close()
+
+
+def fetch_all(template, coords, etags=None):
+    """Per-tile latencies (ms), response ETags and status codes, over one keep-alive connection."""
+    url = urlsplit(template)
+    connection = (http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection)(url.netloc, timeout=10)
+    latencies, tags, statuses = [], [], []
+    for i, (z, x, y) in enumerate(coords):
+        headers = {"User-Agent": USER_AGENT}
+        if etags and etags[i]:
+            headers["If-None-Match"] = etags[i]
+        start = time.perf_counter()
+        connection.request("GET", url.path.format(z=z, x=x, y=y), headers=headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        tags.append(response.getheader("ETag"))
+        statuses.append(response.status)
+    connection.close()
+    return latencies, tags, statuses
+
+
+def report(label, latencies, statuses):
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    codes = ", ".join(f"{code} x{statuses.count(code)}" for code in sorted(set(statuses)))
+    print(f"{label:<28}{statistics.median(latencies):>9.2f}{p95:>9.2f}{max(latencies):>9.2f}   {codes}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bundle", help="MBTiles file to serve (default: a synthetic one)")
+    parser.add_argument("--zooms", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--no-remote", action="store_true", help="skip the public providers")
+    args = parser.parse_args()
+
+    coords = tiles_around(CENTER, args.zooms)
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_path = args.bundle or str(Path(tmp) / "synthetic.mbtiles")
+        if not args.bundle:
+            synthetic_bundle(bundle_path, coords)
+        cache = TileCache()
+        server = make_server({"bench": MBTiles(bundle_path)}, port=0, cache=cache)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        local = f"http://127.0.0.1:{server.server_port}/bench/{{z}}/{{x}}/{{y}}"
+
+        print(f"{len(coords)} tiles, zooms {', '.join(map(str, args.zooms))}")
+        print(f"{'source':<28}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}   status")
+        latencies, etags, statuses = fetch_all(local, coords)
+        report("local (cold)", latencies, statuses)
+        latencies, _, statuses = fetch_all(local, coords)
+        report("local (in-memory cache)", latencies, statuses)
+        latencies, _, statuses = fetch_all(local, coords, etags)
+        report("local (revalidated)", latencies, statuses)
+        print(f"{'':<28}cache: {cache.hits} hits, {cache.misses} misses, {cache.size / 1024:.0f} KB")
+        server.shutdown()
+
+    if args.no_remote:
+        return
+    for name, template in REMOTE.items():
+        try:
+            latencies, _, statuses = fetch_all(template, coords)
+        except OSError as exc:
+            print(f"{name:<28}unreachable ({exc})")
+            continue
+        report(name, latencies, statuses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""City catalogs for the itinerary app.
+
+Each city is one JSON file in ``cities/`` (``cities/<slug>.json``) holding its
+map center, ``attractions``, ``restaurants`` and the default ``itinerary``.
+Attractions and restaurants are parsed into ``records`` types at load.
+Parsed catalogs are memoized per process and keyed by file mtime, so every
+session and every city shares one copy, and editing or dropping in a file is
+picked up without a restart. Catalogs are shared: treat them as read-only.
+"""
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from records import Attraction, Restaurant
+
+CITIES_DIR = Path(os.environ.get("SWIPESCAPES_CITIES_DIR", Path(__file__).parent / "cities"))
+SLUG_PATTERN = re.compile(r"[a-z0-9_-]+")
+REQUIRED_FIELDS = ("name", "center", "attractions", "restaurants", "itinerary")
+
+logger = logging.getLogger(__name__)
+
+
+def city_path(slug):
+    return CITIES_DIR / f"{slug}.json"
+
+
+def list_cities():
+    """``{slug: display name}`` of every valid catalog in ``CITIES_DIR``, sorted by name.
+
+    A catalog that fails to load is logged and left out, so one bad file never
+    takes the other cities down with it.
+    """
+    cities = {}
+    for path in CITIES_DIR.glob("*.json"):
+        try:
+            cities[path.stem] = load_city(path.stem)["name"]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Skipping city catalog %s: %s", path.name, exc)
+    return dict(sorted(cities.items(), key=lambda item: item[1]))
+
+
+@lru_cache(maxsize=64)
+def _parse_city(path, mtime_ns):
+    with open(path, encoding="utf-8") as f:
+        catalog = json.load(f)
+    missing = [field for field in REQUIRED_FIELDS if field not in catalog]
+    if missing:
+        raise ValueError(f"{path}: missing {', '.join(missing)}")
+    places = {**catalog["restaurants"], **catalog["attractions"]}
+    for day_name, day in catalog["itinerary"].items():
+        unknown = [stop["name"] for stop in day["stops"] if stop["name"] not in places]
+        if unknown:
+            raise ValueError(f"{path}: {day_name} has stops missing from the catalog: {', '.join(unknown)}")
+    catalog["attractions"] = {name: Attraction.from_dict(name, data) for name, data in catalog["attractions"].items()}
+    catalog["restaurants"] = {name: Restaurant.from_dict(name, data) for name, data in catalog["restaurants"].items()}
+    catalog.setdefault("zoom_start", 12)
+    catalog["version"] = f"{Path(path).stem}:{mtime_ns}"
+    return catalog
+
+
+def load_city(slug):
+    """Parsed catalog of ``slug``; ``catalog["version"]`` changes whenever its file does."""
+    path = city_path(slug)
+    if not SLUG_PATTERN.fullmatch(slug) or not path.exists():
+        raise KeyError(f"Unknown city: {slug!r}")
+    return _parse_city(str(path), path.stat().st_mtime_ns)
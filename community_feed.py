@@ -0,0 +1,174 @@
+"""Community feed shared by the community pages.
+
+Posts and comments live in the shared SQLite post store (seeded the first time
+it is empty), reactions go through a write-behind ``ReactionBuffer``, and the
+feed is rendered one page at a time with comments fetched only when opened.
+"""
+import html
+import random
+
+import streamlit as st
+
+import profiling
+from post_store import SQLitePostStore, DB_PATH, format_age, page_cursor
+from reactions import ReactionBuffer
+
+PAGE_SIZE = 10  # Posts rendered per feed page
+COMMENTS_SHOWN = 50  # Newest comments fetched when a post's comments are opened
+
+# --- Dummy profile images (emojis for demo) ---
+profile_pics = {
+    "Alice": "👩‍🦱",
+    "Bob": "👨‍🦰",
+    "Clara": "👩‍🦳",
+    "David": "👨",
+    "Eva": "👩",
+    "Frank": "🧔",
+}
+
+# --- Fake post ages for the seed data ---
+def random_hours_ago():
+    return random.choice([2, 5, 12, 24, 48])
+
+# --- Seed posts (written to the post store the first time it is empty) ---
+PARIS_SEED_POSTS = [
+    {"user": "Alice", "content": "Loved the hidden café near Montmartre! Their croissants are amazing. ☕🥐",
+     "type": "gem", "likes": 12, "useful": 8, "not_useful": 1,
+     "comments": ["So true! Must visit."], "hours_ago": random_hours_ago()},
+    {"user": "Bob", "content": "Beware of pickpockets near the Eiffel Tower and Trocadéro 😬. Keep your bag close!",
+     "type": "scam", "likes": 34, "useful": 25, "not_useful": 3,
+     "comments": ["Thanks for the warning!"], "hours_ago": random_hours_ago()},
+    {"user": "Clara", "content": "The Seine boat tour at sunset is magical ✨. Book tickets online to avoid long queues.",
+     "type": "experience", "likes": 20, "useful": 15, "not_useful": 2,
+     "comments": ["Absolutely loved it!"], "hours_ago": random_hours_ago()},
+]
+
+BKK_SEED_POSTS = [
+    {"user": "David", "content": "Chatuchak Market is huge! Go early to avoid crowds and heat 🛍️🌞",
+     "type": "experience", "likes": 18, "useful": 12, "not_useful": 1,
+     "comments": ["Great tip!"], "hours_ago": random_hours_ago()},
+    {"user": "Eva", "content": "Tuk-tuks near Asoke and Sukhumvit are expensive 💸. Grab or metered taxis are better.",
+     "type": "scam", "likes": 40, "useful": 30, "not_useful": 2,
+     "comments": ["Good to know, thanks!"], "hours_ago": random_hours_ago()},
+    {"user": "Frank", "content": "Hidden rooftop bar in Sukhumvit is amazing 🍹. Great view at sunset!",
+     "type": "gem", "likes": 25, "useful": 20, "not_useful": 1,
+     "comments": ["Adding this to my list!"], "hours_ago": random_hours_ago()},
+]
+
+# --- Shared post store (one connection per process, reused across reruns) ---
+@st.cache_resource
+def get_post_store():
+    store = SQLitePostStore(DB_PATH)
+    store.seed("Paris", PARIS_SEED_POSTS)
+    store.seed("Bangkok", BKK_SEED_POSTS)
+    return store
+
+@st.cache_resource
+def get_reaction_buffer():
+    return ReactionBuffer(get_post_store())
+
+# --- Feed callbacks ---
+def update_post_count(post_id, count_key):
+    # Buffered and flushed to the store in batches
+    get_reaction_buffer().record(post_id, count_key)
+
+def add_comment(post_id, widget_key):
+    comment = st.session_state[widget_key].strip()
+    if comment:
+        get_post_store().add_comment(post_id, comment)
+    st.session_state[widget_key] = ""
+
+def toggle_comments(post_id):
+    open_comments = st.session_state.setdefault("open_comments", set())
+    open_comments.symmetric_difference_update({post_id})
+
+def load_more(destination, cursor):
+    st.session_state.setdefault(f"feed_cursors_{destination}", []).append(cursor)
+
+def load_newer(destination):
+    st.session_state[f"feed_cursors_{destination}"].pop()
+
+# --- Reaction bar (a fragment, so a click reruns only this card's buttons) ---
+@st.fragment
+def reaction_bar(post_id, comment_count):
+    counts = get_reaction_buffer().counts(post_id)
+    col1, col2, col3, col4 = st.columns([1,1,1,5])
+    with col1:
+        st.button(f"❤️ {counts['likes']}", key=f"like_{post_id}",
+                  on_click=update_post_count, args=(post_id, "likes"))
+    with col2:
+        st.button(f"👍 {counts['useful']}", key=f"useful_{post_id}",
+                  on_click=update_post_count, args=(post_id, "useful"))
+    with col3:
+        st.button(f"👎 {counts['not_useful']}", key=f"notuseful_{post_id}",
+                  on_click=update_post_count, args=(post_id, "not_useful"))
+    with col4:
+        # Opening comments changes the card below the fragment, so it needs a full rerun
+        if st.button(f"💬 {comment_count} comments", key=f"comments_{post_id}"):
+            toggle_comments(post_id)
+            st.rerun()
+
+# --- Post card function ---
+@profiling.section("post cards")
+def display_posts(destination):
+    # One fixed-size page per rerun; the cursor stack remembers how far the user has paged
+    cursors = st.session_state.setdefault(f"feed_cursors_{destination}", [])
+    post_store = get_post_store()
+    posts = post_store.list_posts(destination, limit=PAGE_SIZE + 1, before=cursors[-1] if cursors else None)
+    has_more = len(posts) > PAGE_SIZE
+    posts = posts[:PAGE_SIZE]
+    open_comments = st.session_state.setdefault("open_comments", set())
+
+    for post in posts:
+        bg = "#fefefe" if post.type=="gem" else "#fff0f0" if post.type=="scam" else "#f0f8ff" 
+        text_color = "#003366" if post.type != "scam" else "#004d00"
+
+        st.markdown(
+            f"""
+            <div style="
+                border:1px solid #e0e0e0;
+                border-radius:15px;
+                padding:15px;
+                margin-bottom:20px;
+                background-color:{bg};
+                box-shadow: 0 1px 3px rgba(0,0,0,0.08);
+            ">
+                <div style="display:flex; align-items:center; gap:10px;">
+                    <span style="font-size:30px;">{profile_pics.get(post.user, '👤')}</span>
+                    <div>
+                        <b style="color: {text_color};">{html.escape(post.user)}</b><br>
+                        <span style="font-size:12px; color:#999999;">{format_age(post.created_at)}</span>
+                    </div>
+                </div>
+                <p style="
+                    margin-top:10px;
+                    font-size:16px; 
+                    line-height:1.5; 
+                    color:{text_color}; 
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                ">{html.escape(post.content)}</p>
+            </div>
+            """, unsafe_allow_html=True
+        )
+
+        reaction_bar(post.id, post.comment_count)
+
+        # Comments are only fetched and rendered once the user opens them
+        if post.id in open_comments:
+            for c in post_store.list_comments(post.id, limit=COMMENTS_SHOWN):
+                st.markdown(f"<div style='margin-left:25px; color:#555;'>💬 {html.escape(c)}</div>", unsafe_allow_html=True)
+
+            comment_key = f"comment_{post.id}"
+            st.text_input("Add a comment:", key=comment_key,
+                          on_change=add_comment, args=(post.id, comment_key))
+
+        st.markdown("---")
+
+    col_newer, col_more = st.columns(2)
+    with col_newer:
+        st.button("⬅️ Newer posts", key=f"newer_{destination}", disabled=not cursors,
+                  on_click=load_newer, args=(destination,))
+    with col_more:
+        if has_more:
+            st.button("Load more ➡️", key=f"more_{destination}",
+                      on_click=load_more, args=(destination, page_cursor(posts[-1])))
@@ -0,0 +1,281 @@
+"""Where-to-go map: a marker, badge, flight path, midpoint and catchment per destination.
+
+Two renderings of the same content:
+
+* detailed - one folium object per element, with animated flight paths. Each
+  becomes its own DOM/SVG node, which is fine for a handful of destinations.
+* scalable - used from ``SCALABLE_FROM`` destinations on. Vector layers are
+  drawn on one canvas (``prefer_canvas``). Destinations are clustered in the
+  browser by ``FastMarkerCluster`` from a single data array, with popups built
+  only when opened. Flight paths are one multi-polyline and midpoints one
+  GeoJSON layer. Badges and catchments are drawn only at ``DETAIL_ZOOM`` and
+  above, and only for destinations in view. The number of DOM nodes then
+  depends on what is on screen, not on the destination count.
+
+Flight paths follow the great circle from the origin, with the midpoint marker
+at the true geodesic midpoint. Arcs come from a ``geo.ArcCache`` simplified for
+``ROUTE_ZOOM``, so rebuilding the map (e.g. for new badge values) reuses them.
+
+Popup and badge markup is one ``${field}`` template used by both renderings
+(filled by ``string.Template`` here, and by the same substitution in the
+browser). folium is imported on first use.
+"""
+import json
+from string import Template
+
+import numpy as np
+
+from geo import ArcCache, geodesic_midpoint
+from tile_server import map_tiles
+
+SCALABLE_FROM = 50
+DETAIL_ZOOM = 5
+# Arcs are simplified for the zoom where badges appear; Leaflet smooths them further when zoomed out
+ROUTE_ZOOM = DETAIL_ZOOM
+TILES = "https://server.arcgisonline.com/ArcGIS/rest/services/Canvas/World_Light_Gray_Base/MapServer/tile/{z}/{y}/{x}"
+TILES_ATTR = "Esri"
+TILESET = "light-gray"  # name of the same basemap on a local tile server
+FLIGHT_COLOR = "#FF6B6B"  # Beautiful coral red
+MIDPOINT_COLOR = "#FFD93D"  # Golden yellow
+# Catchment radius (metres) drawn around each destination
+CATCHMENT_RADIUS = {"Italy": 300000, "France": 300000, "Thailand": 200000, "Cambodia": 150000, "Egypt": 200000}
+DEFAULT_CATCHMENT = 200000
+
+POPUP_TEMPLATE = """
+<div style="
+    width: 300px;
+    padding: 15px;
+    border-radius: 15px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    box-shadow: 0 8px 20px rgba(0,0,0,0.3);
+    font-family: 'Poppins', sans-serif;
+    color: white;">
+    <h3 style="margin:0 0 10px 0; color: white; border-bottom: 2px solid rgba(255,255,255,0.3); padding-bottom: 8px;">
+        ✈️ ${name}
+    </h3>
+    <div style="background: rgba(255,255,255,0.1); padding: 10px; border-radius: 10px; margin-bottom: 8px;">
+        <b>🛂 Visa:</b> ${visa}<br>
+        <b>⏱️ Processing:</b> ${visa_time}<br>
+        <b>💰 Funds:</b> ${funds}<br>
+        <b>💵 Cost/day:</b> ${cost}
+    </div>
+    <b>🌟 Known for:</b> ${known_for}<br>
+    <div style="margin-top: 10px;">
+        <b>🛡️ Safety Index: ${safety}%</b>
+        <div style='width:100%; background-color:rgba(255,255,255,0.3); border-radius:5px; height:12px; margin-top:5px;'>
+            <div style='width:${safety}%; background-color:${safety_color}; height:12px; border-radius:5px; transition: width 0.3s;'></div>
+        </div>
+    </div>
+</div>
+"""
+
+BADGE_TEMPLATE = """
+<div style="
+    background: linear-gradient(135deg, ${color}, ${shade});
+    color:white;
+    font-weight:bold;
+    border-radius:50%;
+    width:35px;
+    height:35px;
+    text-align:center;
+    line-height:35px;
+    border:3px solid white;
+    box-shadow: 0 4px 10px rgba(0,0,0,0.3);
+    font-family: 'Poppins', sans-serif;">
+    ${badge}
+</div>
+"""
+
+ORIGIN_POPUP = """
+<div style="font-family: 'Poppins', sans-serif; padding: 10px; text-align: center;">
+    <h3 style="color: #667eea; margin: 0;">🏠 ${city}</h3>
+    <p style="margin: 5px 0; color: #666;">Your Journey Starts Here</p>
+</div>
+"""
+
+# Same ${field} substitution as string.Template, for templates filled in the browser
+_JS_FILL = "function (template, values) { return template.replace(/\\$\\{(\\w+)\\}/g, function (_, key) { return values[key]; }); }"
+
+_CLUSTER_CALLBACK = Template("""function (row) {
+    var fill = $fill;
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {
+        icon: L.AwesomeMarkers.icon({icon: row[2], prefix: "fa", markerColor: "darkpurple"})
+    });
+    marker.bindPopup(function () { return fill($popup, row[3]); }, {maxWidth: 320});
+    return marker;
+}""")
+
+_ZOOMED_DETAILS = """
+{% macro script(this, kwargs) %}
+(function () {
+    var map = {{ this._parent.get_name() }};
+    var rows = {{ this.rows|tojson }};
+    var badge = {{ this.badge_template|tojson }};
+    var fill = {{ this.fill }};
+    var layer = L.layerGroup().addTo(map);
+    function refresh() {
+        layer.clearLayers();
+        if (map.getZoom() < {{ this.min_zoom }}) { return; }
+        var view = map.getBounds().pad(0.25);
+        rows.forEach(function (row) {
+            if (!view.contains([row[0], row[1]])) { return; }
+            L.circle([row[0], row[1]], {radius: row[5], color: "#667eea", fill: true, fillColor: "#764ba2",
+                                        fillOpacity: 0.15, weight: 2, opacity: 0.5, interactive: false}).addTo(layer);
+            L.marker([row[0] + 0.5, row[1]], {interactive: false, icon: L.divIcon({
+                className: "", html: fill(badge, {badge: row[2], color: row[3], shade: row[4]})
+            })}).addTo(layer);
+        });
+    }
+    map.on("zoomend moveend", refresh);
+    refresh();
+})();
+{% endmacro %}
+"""
+
+
+def popup_fields(loc):
+    """Values for ``POPUP_TEMPLATE`` from a ``records.Destination``."""
+    return {
+        "name": loc.name, "visa": loc.visa, "visa_time": loc.visa_time, "funds": loc.funds,
+        "cost": loc.cost_label, "known_for": loc.known_for, "safety": loc.safety,
+        # Safety color
+        "safety_color": "#4ECDC4" if loc.safety > 30 else "#FF6B6B",
+    }
+
+
+def catchment_radius(loc):
+    return CATCHMENT_RADIUS.get(loc.country, DEFAULT_CATCHMENT)
+
+
+def flight_geometry(destinations, origin, arcs=None):
+    """Great-circle route and geodesic midpoint ``[lat, lon]`` from ``origin`` to each destination."""
+    lats = np.array([loc.lat for loc in destinations], dtype=float)
+    lons = np.array([loc.lon for loc in destinations], dtype=float)
+    arcs = arcs if arcs is not None else ArcCache()
+    routes = arcs.arcs((origin["Lat"], origin["Lon"]), lats, lons, ROUTE_ZOOM)
+    mid_lats, mid_lons = geodesic_midpoint(origin["Lat"], origin["Lon"], lats, lons)
+    return routes, np.column_stack([mid_lats, mid_lons]).round(5).tolist()
+
+
+def build_destination_map(destinations, origin, badges, colors, shades, scalable=None, arcs=None):
+    """folium map of ``destinations`` (``records.Destination``) seen from ``origin``.
+
+    ``badges``, ``colors`` and ``shades`` give each destination's where-to-go
+    index and its two badge gradient colours. ``scalable`` picks the rendering
+    (default: scalable from ``SCALABLE_FROM`` destinations); ``arcs`` is a
+    shared ``geo.ArcCache``.
+    """
+    import folium
+
+    if scalable is None:
+        scalable = len(destinations) >= SCALABLE_FROM
+    routes, midpoints = flight_geometry(destinations, origin, arcs)
+    # Use a more beautiful map tile
+    tiles, attr = map_tiles(TILESET, TILES, TILES_ATTR)
+    m = folium.Map(location=[20, 50], zoom_start=3, tiles=tiles, attr=attr, prefer_canvas=scalable)
+
+    # Origin marker with enhanced styling
+    folium.Marker(
+        location=[origin["Lat"], origin["Lon"]],
+        popup=folium.Popup(Template(ORIGIN_POPUP).substitute(city=origin["City"]), max_width=200),
+        icon=folium.Icon(color="green", icon="home", prefix="fa"),
+    ).add_to(m)
+
+    layers = _add_scalable_layers if scalable else _add_detailed_layers
+    layers(m, destinations, routes, midpoints, badges, colors, shades)
+    return m
+
+
+def _add_detailed_layers(m, destinations, routes, midpoints, badges, colors, shades):
+    import folium
+    from folium.plugins import AntPath
+
+    for loc, route, midpoint, badge, color, shade in zip(destinations, routes, midpoints, badges, colors, shades):
+        # Destination marker
+        folium.Marker(
+            location=[loc.lat, loc.lon],
+            popup=folium.Popup(Template(POPUP_TEMPLATE).substitute(popup_fields(loc)), max_width=320),
+            icon=folium.Icon(color="darkpurple", icon=loc.icon, prefix="fa"),
+        ).add_to(m)
+
+        # Where to Go Index badge with improved styling
+        folium.map.Marker(
+            [loc.lat + 0.5, loc.lon],
+            icon=folium.DivIcon(html=Template(BADGE_TEMPLATE).substitute(badge=badge, color=color, shade=shade)),
+        ).add_to(m)
+
+        # Flight line with animated path
+        AntPath(
+            locations=route,
+            color=FLIGHT_COLOR,
+            weight=3,
+            opacity=0.7,
+            dash_array=[10, 20],
+            delay=800,
+            pulse_color=MIDPOINT_COLOR,
+        ).add_to(m)
+
+        # Midpoint with glow effect
+        folium.CircleMarker(
+            location=midpoint,
+            radius=6,
+            color=MIDPOINT_COLOR,
+            fill=True,
+            fill_color=MIDPOINT_COLOR,
+            fill_opacity=0.9,
+            weight=2,
+        ).add_to(m)
+
+        # Catchment area with gradient effect
+        folium.Circle(
+            location=[loc.lat, loc.lon],
+            radius=catchment_radius(loc),
+            color="#667eea",
+            fill=True,
+            fill_color="#764ba2",
+            fill_opacity=0.15,
+            weight=2,
+            opacity=0.5,
+        ).add_to(m)
+
+
+def _add_scalable_layers(m, destinations, routes, midpoints, badges, colors, shades):
+    import folium
+    from branca.element import MacroElement
+    from folium.plugins import FastMarkerCluster
+    from folium.template import Template as JinjaTemplate
+
+    # Flight lines: one canvas multi-polyline for every route
+    folium.PolyLine(routes, color=FLIGHT_COLOR, weight=2, opacity=0.5, interactive=False).add_to(m)
+
+    # Midpoints: one GeoJSON layer of canvas circle markers
+    features = [{"type": "Feature", "properties": {}, "geometry": {"type": "Point", "coordinates": [lon, lat]}}
+                for lat, lon in midpoints]
+    midpoint_marker = folium.CircleMarker(
+        radius=5,
+        color=MIDPOINT_COLOR,
+        fill=True,
+        fill_color=MIDPOINT_COLOR,
+        fill_opacity=0.9,
+        weight=1,
+    )
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        marker=midpoint_marker,
+    ).add_to(m)
+
+    # Destinations: clustered in the browser, popups rendered when opened
+    FastMarkerCluster(
+        [[loc.lat, loc.lon, loc.icon, popup_fields(loc)] for loc in destinations],
+        callback=_CLUSTER_CALLBACK.substitute(fill=_JS_FILL, popup=json.dumps(POPUP_TEMPLATE)),
+    ).add_to(m)
+
+    # Badges and catchments: only when zoomed in, only for what is in view
+    details = MacroElement()
+    details._template = JinjaTemplate(_ZOOMED_DETAILS)
+    details.rows = [[loc.lat, loc.lon, int(badge), str(color), str(shade), catchment_radius(loc)]
+                    for loc, badge, color, shade in zip(destinations, badges, colors, shades)]
+    details.badge_template = BADGE_TEMPLATE
+    details.fill = _JS_FILL
+    details.min_zoom = DETAIL_ZOOM
+    details.add_to(m)
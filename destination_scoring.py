@@ -0,0 +1,70 @@
+"""Where-to-go index computed from each destination's data.
+
+The index (0-100) is a weighted mean of four factor scores in [0, 1], higher
+being better: safety, daily cost, visa burden (requirement and processing
+time) and flight distance from the origin. Factors are scaled against fixed
+reference ranges, so adding destinations never changes anyone else's score.
+
+Factor scores depend only on the data and are computed once per catalog as an
+n x 4 matrix. Applying a set of weights is then a single matrix-vector
+product, so re-scoring hundreds of destinations on every slider move takes
+microseconds. Colours come from a precomputed palette by vectorized lookup.
+"""
+import numpy as np
+
+from geo import haversine_km
+
+FACTORS = ("safety", "cost", "visa", "distance")
+FACTOR_LABELS = {
+    "safety": "🛡️ Safety",
+    "cost": "💵 Daily cost",
+    "visa": "🛂 Visa hassle",
+    "distance": "✈️ Flight distance",
+}
+DEFAULT_WEIGHTS = {"safety": 0.40, "cost": 0.25, "visa": 0.20, "distance": 0.15}
+# Share of the visa factor lost for the requirement itself; the rest scales with processing days
+VISA_LEVELS = {"No": 0.0, "E-visa/VoA": 0.3, "Yes": 1.0}
+COST_CAP_INR = 25_000  # per day; at or above scores 0
+VISA_DAYS_CAP = 20
+DISTANCE_CAP_KM = 12_000
+
+# Red (low) to green (high), the colours the badges always used
+_LOW_RGB = np.array([255, 76, 76])
+_HIGH_RGB = np.array([76, 175, 80])
+_PALETTE = np.array([
+    f"rgb({r},{g},{b})"
+    for r, g, b in (np.outer(1 - np.linspace(0, 1, 256), _LOW_RGB) + np.outer(np.linspace(0, 1, 256), _HIGH_RGB))
+    .astype(int)
+])
+
+
+def factor_scores(destinations, origin):
+    """``len(destinations)`` x 4 matrix of factor scores in [0, 1], columns in ``FACTORS`` order.
+
+    ``destinations`` is a ``records.RecordTable`` of ``Destination``; ``origin``
+    a ``(lat, lon)`` pair.
+    """
+    distance_km = haversine_km(origin[0], origin[1], destinations.column("lat", float), destinations.column("lon", float))
+    visa_level = np.array([VISA_LEVELS.get(visa, 1.0) for visa in destinations.column("visa")], dtype=float)
+    visa_burden = 0.5 * visa_level + 0.5 * np.minimum(destinations.column("visa_days", float) / VISA_DAYS_CAP, 1.0)
+    return np.column_stack([
+        destinations.column("safety", float) / 100,
+        1 - np.minimum(destinations.column("cost_inr", float) / COST_CAP_INR, 1.0),
+        1 - visa_burden,
+        1 - np.minimum(distance_km / DISTANCE_CAP_KM, 1.0),
+    ]).clip(0.0, 1.0)
+
+
+def where_to_go_index(factors, weights):
+    """Index (0-100) per row of ``factors`` for ``{factor: weight}``; all-zero weights count equally."""
+    vector = np.array([max(weights.get(name, 0.0), 0.0) for name in FACTORS], dtype=float)
+    if not vector.sum():
+        vector[:] = 1.0
+    return factors @ (vector / vector.sum()) * 100
+
+
+def index_colors(scores, low, high):
+    """``"rgb(...)"`` per score, red at ``low`` through green at ``high``."""
+    scores = np.asarray(scores, dtype=float)
+    norm = (scores - low) / (high - low) if high > low else np.ones_like(scores)
+    return _PALETTE[np.rint(np.clip(norm, 0.0, 1.0) * 255).astype(int)]
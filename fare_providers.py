@@ -0,0 +1,186 @@
+"""Fare sources behind the flight booking pages.
+
+``FareProvider`` is the interface a fare source implements (one coroutine,
+``search``). ``FareService`` queries all of its providers concurrently on one
+background asyncio loop per process and merges the results. Each query is
+cached for ``ttl`` seconds, and identical searches that arrive while one is in
+flight share that upstream call. Once an entry expires, callers get the
+stale result immediately while a refresh runs in the background, so a rerun
+only waits for a query nobody has asked for yet.
+
+``MockFareProvider`` generates deterministic synthetic itineraries after a
+configurable delay, for offline throughput and tail-latency testing.
+"""
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from records import DELAY_LEVELS, Flight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300
+DEFAULT_TIMEOUT = 5.0
+MAX_CACHED_QUERIES = 1024
+# Adds a MockFareProvider to every page's providers, e.g. SWIPESCAPES_MOCK_FARES=5000
+MOCK_FARES = int(os.environ.get("SWIPESCAPES_MOCK_FARES", "0"))
+MOCK_LATENCY = float(os.environ.get("SWIPESCAPES_MOCK_LATENCY", "0.2"))
+MOCK_CARRIERS = ["Air India", "Emirates", "Air France", "Lufthansa", "Qatar Airways", "IndiGo", "KLM", "Etihad"]
+
+
+def fare_query(origin, destination, depart_date, return_date):
+    """Hashable key identifying one search."""
+    return (origin, destination, depart_date, return_date)
+
+
+def synthetic_flights(size, depart_date="2025-04-03", return_date="2025-04-16", seed=0, carriers=MOCK_CARRIERS):
+    """``size`` random itinerary dicts shaped like the flight pages' data."""
+    rng = random.Random(seed)
+    flights = []
+    for _ in range(size):
+        dep = rng.randrange(24 * 60)
+        duration = rng.randrange(300, 1200, 5)
+        arr = dep + duration
+        ret = rng.randrange(24 * 60)
+        flights.append({
+            "carrier": rng.choice(carriers),
+            "departure": f"{depart_date} {dep // 60:02d}:{dep % 60:02d}",
+            "arrival": f"{depart_date} {arr // 60 % 24:02d}:{arr % 60:02d}",
+            "return_dep": f"{return_date} {ret // 60:02d}:{ret % 60:02d}",
+            "return_arr": f"{return_date} {(ret + duration) // 60 % 24:02d}:{(ret + duration) % 60:02d}",
+            "duration": f"{duration // 60}h {duration % 60}m",
+            "cost": rng.randrange(35_000, 150_000, 500),
+            "cancellation": f"{rng.randint(0, 6)}%",
+            "delays": rng.choice(list(DELAY_LEVELS)),
+            "audience": "Simulated fare",
+            "rating": rng.randint(50, 95),
+        })
+    return flights
+
+
+class FareProvider(ABC):
+    """One upstream source of itineraries."""
+
+    name = "provider"
+
+    @abstractmethod
+    async def search(self, query):
+        """``records.Flight`` itineraries for a ``fare_query`` key."""
+
+
+class StaticFareProvider(FareProvider):
+    """Serves a fixed list of itinerary dicts for one route, parsed once up front."""
+
+    def __init__(self, name, route, flights):
+        self.name = name
+        self.route = route
+        self.flights = [Flight.from_dict(flight) for flight in flights]
+
+    async def search(self, query):
+        return self.flights if query[:2] == self.route else []
+
+
+class MockFareProvider(FareProvider):
+    """Synthetic itineraries after ``latency`` (+ up to ``jitter``) seconds.
+
+    Results depend only on the query, so repeated searches are stable;
+    ``failure_rate`` makes that share of calls raise, to exercise error paths.
+    """
+
+    def __init__(self, name="mock", size=200, latency=0.2, jitter=0.1, failure_rate=0.0):
+        self.name = name
+        self.size = size
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.calls = 0
+
+    async def search(self, query):
+        self.calls += 1
+        await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+        if random.random() < self.failure_rate:
+            raise ConnectionError(f"{self.name}: simulated upstream failure")
+        seed = f"{self.name}:{query}"
+        flights = synthetic_flights(self.size, depart_date=query[2], return_date=query[3], seed=seed)
+        return [Flight.from_dict(flight) for flight in flights]
+
+
+def default_providers(route, flights):
+    """Providers for a page serving ``route``: its own itineraries, plus the mock if enabled."""
+    providers = [StaticFareProvider("SwipeScapes", route, flights)]
+    if MOCK_FARES:
+        providers.append(MockFareProvider(size=MOCK_FARES, latency=MOCK_LATENCY))
+    return providers
+
+
+class FareService:
+    """Concurrent, cached and coalesced search over several providers.
+
+    Safe to share between sessions: callers on any thread use ``search``, and
+    all upstream work happens on the service's own event loop thread.
+    """
+
+    def __init__(self, providers, ttl=DEFAULT_TTL, timeout=DEFAULT_TIMEOUT, max_entries=MAX_CACHED_QUERIES):
+        self.providers = list(providers)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self._cache = {}
+        self._inflight = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fare-service", daemon=True)
+        self._thread.start()
+
+    def search(self, query, timeout=None):
+        """``(flights, fetched_at)`` for ``query``, blocking only on a cold cache."""
+        future = asyncio.run_coroutine_threadsafe(self.fetch(query), self._loop)
+        return future.result(timeout)
+
+    async def fetch(self, query):
+        now = time.monotonic()
+        cached = self._cache.get(query)
+        if cached is not None:
+            expires_at, result = cached
+            if now >= expires_at:
+                self._refresh(query)
+            return result
+        return await self._refresh(query)
+
+    def _refresh(self, query):
+        """Shared task fetching ``query`` from every provider (started if none is running)."""
+        task = self._inflight.get(query)
+        if task is None:
+            task = self._loop.create_task(self._fetch_all(query))
+            self._inflight[query] = task
+            task.add_done_callback(lambda _: self._inflight.pop(query, None))
+        return task
+
+    async def _fetch_all(self, query):
+        results = await asyncio.gather(
+            *(asyncio.wait_for(provider.search(query), self.timeout) for provider in self.providers),
+            return_exceptions=True,
+        )
+        flights = []
+        failures = 0
+        for provider, result in zip(self.providers, results):
+            if isinstance(result, BaseException):
+                failures += 1
+                logger.warning("Fare provider %s failed for %s: %r", provider.name, query, result)
+                continue
+            flights.extend(result)
+        result = (flights, time.time())
+        # A search where every provider failed is retried on the next request instead of cached
+        if failures < len(self.providers):
+            self._cache.pop(query, None)
+            self._cache[query] = (time.monotonic() + self.ttl, result)
+            while len(self._cache) > self.max_entries:
+                self._cache.pop(next(iter(self._cache)))
+        return result
+
+    def close(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=1)
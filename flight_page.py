@@ -0,0 +1,118 @@
+"""Flight search shared by the per-route booking pages.
+
+Fares come from the route's ``FareService`` and are indexed by a
+``FlightIndex``. The sidebar filters and sorts them, and recommendations are
+drawn from every match. The page on screen is rendered with the calling
+page's own card markup and a paging footer. Each page keeps only its route,
+its itineraries and its cards.
+"""
+import datetime
+
+import streamlit as st
+
+from fare_providers import FareService, default_providers, fare_query
+from flight_recommender import recommend
+from flight_search import DELAY_LEVELS, SORT_FIELDS, FlightIndex
+
+PAGE_SIZE = 10
+
+
+@st.cache_resource
+def get_fare_service(route, _flights):
+    """Fare providers for ``route`` behind one shared cache, created once per process."""
+    return FareService(default_providers(route, _flights))
+
+
+@st.cache_resource(max_entries=8)
+def get_flight_index(query, fetched_at, _flights):
+    """Columnar search index over one fetched result set, built once per fetch."""
+    return FlightIndex(_flights)
+
+
+def to_minutes(t):
+    return t.hour * 60 + t.minute
+
+
+def reset_page():
+    st.session_state.flight_page = 0
+
+
+def change_page(step):
+    st.session_state.flight_page += step
+
+
+def filters(flight_index):
+    """Sidebar filter and sort widgets; returns ``matching`` keyword arguments, the sort field and order."""
+    with st.sidebar:
+        st.header("🔎 Filter & Sort")
+        # Slider ranges are widened to whole steps so a single-fare route still gets a usable slider
+        min_cost, max_cost = flight_index.bounds("cost")
+        min_cost, max_cost = min_cost // 1000 * 1000, max(-(-max_cost // 1000) * 1000, min_cost // 1000 * 1000 + 1000)
+        max_price = st.slider("Max price (₹)", min_cost, max_cost, max_cost, step=1000, on_change=reset_page)
+        min_duration, max_duration = flight_index.bounds("duration_min")
+        min_hours, max_hours = min_duration // 60, max(-(-max_duration // 60), min_duration // 60 + 1)
+        max_hours = st.slider("Max duration (hours)", float(min_hours), float(max_hours), float(max_hours),
+                              step=0.25, on_change=reset_page)
+        departure_window = st.slider(
+            "Departure window",
+            value=(datetime.time(0, 0), datetime.time(23, 59)),
+            step=datetime.timedelta(minutes=30),
+            on_change=reset_page,
+        )
+        carriers = st.multiselect("Carriers", flight_index.carriers, on_change=reset_page)
+        max_delay = st.select_slider("Max delay risk", options=list(DELAY_LEVELS), value=list(DELAY_LEVELS)[-1],
+                                     on_change=reset_page)
+        sort_by = st.selectbox("Sort by", list(SORT_FIELDS), on_change=reset_page)
+        descending = st.toggle("Descending", on_change=reset_page)
+    criteria = {
+        "max_price": max_price,
+        "max_duration": round(max_hours * 60),
+        "departure_window": (to_minutes(departure_window[0]), to_minutes(departure_window[1])),
+        "carriers": carriers,
+        "max_delay": max_delay,
+    }
+    return criteria, sort_by, descending
+
+
+def paging_footer(total_matches, page_count):
+    if not total_matches:
+        st.info("No flights match your filters.")
+    prev_col, info_col, next_col = st.columns([1, 4, 1])
+    with prev_col:
+        st.button("⬅️ Previous", disabled=st.session_state.flight_page == 0,
+                  on_click=change_page, args=(-1,), use_container_width=True)
+    with info_col:
+        st.caption(f"Page {st.session_state.flight_page + 1} of {page_count} · {total_matches:,} flight{'s' if total_matches != 1 else ''}")
+    with next_col:
+        st.button("Next ➡️", disabled=st.session_state.flight_page + 1 >= page_count,
+                  on_click=change_page, args=(1,), use_container_width=True)
+
+
+def render_flight_search(route, dates, flights, traveler_type, card):
+    """Search ``flights`` (itinerary dicts) for ``route`` (origin, destination) on ``dates`` (depart, return).
+
+    Draws the sidebar filters, then ``card(flight, recommendation)`` for each
+    flight on the current page (``recommendation`` is ``None`` unless it is
+    one for ``traveler_type``), then the paging footer.
+    """
+    query = fare_query(*route, *dates)
+    fares, fetched_at = get_fare_service(tuple(route), flights).search(query)
+    flight_index = get_flight_index(query, fetched_at, fares)
+    criteria, sort_by, descending = filters(flight_index)
+
+    st.session_state.setdefault("flight_page", 0)
+    matches = flight_index.matching(**criteria)
+    # Recommendations come from the whole filtered set, not just the page on screen
+    recommendations = recommend(flight_index, matches, traveler_type)
+    page_positions, total_matches = flight_index.search(
+        matches=matches,
+        sort_by=sort_by,
+        descending=descending,
+        offset=st.session_state.flight_page * PAGE_SIZE,
+        limit=PAGE_SIZE,
+    )
+    page_count = max(1, -(-total_matches // PAGE_SIZE))
+
+    for position in page_positions:
+        card(flight_index.flights[position], recommendations.get(position))
+    paging_footer(total_matches, page_count)
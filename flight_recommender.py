@@ -0,0 +1,112 @@
+"""Pareto-optimal flight recommendations per traveller type.
+
+Candidates are reduced to the non-dominated set over cost, duration,
+cancellation rate, delay risk and family rating (no other itinerary is at
+least as good on all five and better on one). That set is then ranked with the
+traveller type's weights over min-max normalised objectives. Everything works
+on ``FlightIndex`` columns, so thousands of candidates take a few
+milliseconds.
+"""
+import numpy as np
+
+# (FlightIndex column, sign): objectives are minimised, so the rating is negated
+OBJECTIVES = {
+    "cost": ("cost", 1),
+    "duration": ("duration_min", 1),
+    "cancellation": ("cancellation", 1),
+    "delay": ("delay_level", 1),
+    "rating": ("rating", -1),
+}
+TRAVELLER_WEIGHTS = {
+    "Family": {"cost": 0.20, "duration": 0.15, "cancellation": 0.15, "delay": 0.20, "rating": 0.30},
+    "Business": {"cost": 0.05, "duration": 0.35, "cancellation": 0.20, "delay": 0.30, "rating": 0.10},
+    "Budget": {"cost": 0.60, "duration": 0.10, "cancellation": 0.10, "delay": 0.10, "rating": 0.10},
+}
+BEST_LABELS = {
+    "cost": "Lowest fare",
+    "duration": "Shortest flight",
+    "cancellation": "Lowest cancellation rate",
+    "delay": "Lowest delay risk",
+    "rating": "Top family rating",
+}
+STRONG_LABELS = {
+    "cost": "Competitive fare",
+    "duration": "Short flight",
+    "cancellation": "Low cancellation rate",
+    "delay": "Low delay risk",
+    "rating": "High family rating",
+}
+REASON_PARTS = 2
+
+
+def pareto_front(costs):
+    """Row positions of the non-dominated rows of ``costs`` (n x k, all minimised).
+
+    Each pass keeps only the rows that beat the current row on some objective
+    (or tie it everywhere), so the work shrinks as dominated rows drop out.
+    """
+    positions = np.arange(len(costs))
+    i = 0
+    while i < len(costs):
+        keep = np.any(costs < costs[i], axis=1) | np.all(costs == costs[i], axis=1)
+        positions, costs = positions[keep], costs[keep]
+        i = int(np.count_nonzero(keep[:i])) + 1
+    return positions
+
+
+def _describe(flight, objective):
+    if objective == "cost":
+        return f"₹{flight.cost:,}"
+    if objective == "duration":
+        return flight.duration
+    if objective == "cancellation":
+        return flight.cancellation_label
+    if objective == "delay":
+        return flight.delays
+    return f"{flight.rating}%"
+
+
+def recommend(index, candidates=None, traveller="Family", top=2):
+    """Best ``top`` Pareto-optimal candidates for ``traveller``, best first.
+
+    ``candidates`` are ``FlightIndex`` positions (all itineraries by default).
+    Returns ``{position: {"rank", "score", "reason"}}``; scores are in [0, 1].
+    """
+    if candidates is None:
+        candidates = np.arange(len(index))
+    candidates = np.asarray(candidates)
+    if not len(candidates):
+        return {}
+
+    names = list(OBJECTIVES)
+    costs = np.column_stack([
+        sign * getattr(index, column)[candidates].astype(np.float64) for column, sign in OBJECTIVES.values()
+    ])
+    # 0 = best value among all candidates, 1 = worst
+    low, span = costs.min(axis=0), np.ptp(costs, axis=0)
+    normalised = np.divide(costs - low, span, out=np.zeros_like(costs), where=span > 0)
+    weights = np.array([TRAVELLER_WEIGHTS[traveller][name] for name in names])
+
+    # Visiting the best weighted rows first lets them knock out most of the field early
+    by_score = np.argsort(normalised @ weights, kind="stable")
+    front = by_score[pareto_front(normalised[by_score])]
+    normalised = normalised[front]
+    contributions = weights * (1 - normalised)
+    scores = contributions.sum(axis=1) / weights.sum()
+
+    order = np.argsort(-scores, kind="stable")[:top]
+    recommendations = {}
+    for rank, row in enumerate(order, 1):
+        position = int(candidates[front[row]])
+        flight = index.flights[position]
+        strengths = np.argsort(-contributions[row], kind="stable")[:REASON_PARTS]
+        parts = [
+            f"{(BEST_LABELS if normalised[row, j] == 0 else STRONG_LABELS)[names[j]]} ({_describe(flight, names[j])})"
+            for j in strengths
+        ]
+        recommendations[position] = {
+            "rank": rank,
+            "score": float(scores[row]),
+            "reason": f"{' and '.join(parts)}; no other option in this search beats it on every count.",
+        }
+    return recommendations
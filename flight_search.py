@@ -0,0 +1,95 @@
+"""Columnar flight search behind the flight booking pages.
+
+Itineraries (``records.Flight``, parsed once when fetched) are held as NumPy
+columns (duration in minutes, cost, cancellation rate, delay level, departure
+minute of day), so filtering is a handful of boolean masks and only the
+requested page is sorted in full. A query over 100k itineraries takes a few
+milliseconds.
+"""
+import numpy as np
+
+from records import DELAY_LEVELS, RecordTable
+
+SORT_FIELDS = {
+    "Price": "cost",
+    "Duration": "duration_min",
+    "Departure time": "dep_minute",
+    "Delay risk": "delay_level",
+    "Cancellation rate": "cancellation",
+}
+
+
+class FlightIndex:
+    """Column arrays over ``records.Flight`` itineraries, with filter/sort/page queries."""
+
+    def __init__(self, flights):
+        table = RecordTable(flights)
+        self.flights = table.records
+        # Carriers are stored as codes into a sorted name table, so carrier filters compare integers
+        self.carrier_names, self.carrier_code = np.unique(table.column("carrier", dtype=object), return_inverse=True)
+        self.cost = table.column("cost", dtype=np.int64)
+        self.duration_min = table.column("duration_min", dtype=np.int32)
+        self.cancellation = table.column("cancellation", dtype=np.float32)
+        self.delay_level = table.column("delay_level", dtype=np.int8)
+        self.rating = table.column("rating", dtype=np.int16)
+        self.dep_minute = table.column("dep_minute", dtype=np.int16)
+
+    def __len__(self):
+        return len(self.flights)
+
+    @property
+    def carriers(self):
+        return list(self.carrier_names)
+
+    def bounds(self, field):
+        """``(min, max)`` of a numeric column, for slider ranges."""
+        column = getattr(self, field)
+        if not len(column):
+            return (0, 0)
+        return (column.min().item(), column.max().item())
+
+    def matching(self, max_price=None, max_duration=None, departure_window=None, carriers=None, max_delay=None):
+        """Positions of the itineraries that pass every filter, in input order.
+
+        ``departure_window`` is ``(earliest, latest)`` in minutes after midnight;
+        ``max_delay`` is a ``DELAY_LEVELS`` key.
+        """
+        mask = np.ones(len(self.flights), dtype=bool)
+        if max_price is not None:
+            mask &= self.cost <= max_price
+        if max_duration is not None:
+            mask &= self.duration_min <= max_duration
+        if departure_window is not None:
+            earliest, latest = departure_window
+            mask &= (self.dep_minute >= earliest) & (self.dep_minute <= latest)
+        if carriers:
+            mask &= np.isin(self.carrier_code, np.flatnonzero(np.isin(self.carrier_names, list(carriers))))
+        if max_delay is not None:
+            mask &= self.delay_level <= DELAY_LEVELS[max_delay]
+        return np.flatnonzero(mask)
+
+    def search(self, sort_by="Price", descending=False, offset=0, limit=10, matches=None, **filters):
+        """Positions of one page of matching itineraries, and the total number of matches.
+
+        ``filters`` are the arguments of ``matching``; pass ``matches`` instead to
+        reuse positions already computed for this rerun. Ties are broken by
+        price, then input order, so paging is stable.
+        """
+        if matches is None:
+            matches = self.matching(**filters)
+        primary = getattr(self, SORT_FIELDS[sort_by])[matches]
+        if descending:
+            primary = -primary.astype(np.float64)
+        end = min(offset + limit, len(matches))
+        if offset >= end:
+            return [], len(matches)
+
+        # Only the rows up to the end of the page need a full, tie-broken sort
+        if end < len(matches):
+            cutoff = np.partition(primary, end - 1)[end - 1]
+            candidates = np.flatnonzero(primary <= cutoff)
+        else:
+            candidates = np.arange(len(matches))
+        order = np.lexsort((matches[candidates], self.cost[matches[candidates]], primary[candidates]))
+        page = matches[candidates[order[offset:end]]]
+        return page.tolist(), len(matches)
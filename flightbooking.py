@@ -1,4 +1,6 @@
 import streamlit as st
+from flight_page import render_flight_search
+from flight_recommender import TRAVELLER_WEIGHTS
 
 # --- Page config ---
 st.set_page_config(page_title="Flight Booking - BLR to Paris", layout="wide")
@@ -6,7 +8,8 @@ st.set_page_config(page_title="Flight Booking - BLR to Paris", layout="wide")
 # --- Title ---
 st.title("✈️ Flights: Bangalore → Paris")
 st.markdown("Travel Dates: **April 3 → April 16**")
-st.markdown("Traveler Type: **Family**")
+traveler_type = st.sidebar.selectbox("Traveler type", list(TRAVELLER_WEIGHTS))
+st.markdown(f"Traveler Type: **{traveler_type}**")
 
 # --- Sample Flight Data (Multiple Carriers) ---
 flight_itineraries = [
@@ -22,8 +25,6 @@ flight_itineraries = [
         "delays": "Low",
         "audience": "Family Friendly",
         "rating": 78,
-        "recommended": True,
-        "reason": "Full carrier with vegetarian meals, in-flight entertainment, and good legroom. Highly preferred by family travelers."
     },
     {
         "carrier": "Emirates",
@@ -37,8 +38,6 @@ flight_itineraries = [
         "delays": "Medium",
         "audience": "Luxury / Family",
         "rating": 82,
-        "recommended": True,
-        "reason": "Premium experience with comfortable seats and great service. Popular among family travelers."
     },
     {
         "carrier": "Air France",
@@ -52,8 +51,6 @@ flight_itineraries = [
         "delays": "Low",
         "audience": "Budget-Conscious Families",
         "rating": 75,
-        "recommended": False,
-        "reason": "Reliable carrier with decent meals and comfortable seating. Preferred by budget-conscious family travelers."
     },
     {
         "carrier": "Lufthansa",
@@ -67,52 +64,52 @@ flight_itineraries = [
         "delays": "Medium",
         "audience": "Business / Family",
         "rating": 70,
-        "recommended": False,
-        "reason": "Good option for those who prefer European carriers; slightly higher delay risk."
     },
 ]
 
-# --- Display Flight Cards ---
-st.subheader("Available Flights")
-st.markdown("Recommended options are highlighted for your convenience.")
-
-for idx, flight in enumerate(flight_itineraries):
+# --- Flight Cards ---
+def flight_card(flight, recommendation):
     # Use Streamlit columns and markdown instead of HTML
     col1, col2 = st.columns([1, 10])
     
     with col1:
-        if flight["recommended"]:
+        if recommendation:
             st.write("⭐")
     
     with col2:
-        if flight["recommended"]:
-            st.info(f"**{flight['carrier']}** (Recommended)")
+        if recommendation:
+            st.info(f"**{flight.carrier}** (Recommended #{recommendation['rank']} for {traveler_type} travelers)")
         else:
-            st.write(f"**{flight['carrier']}**")
+            st.write(f"**{flight.carrier}**")
     
     # Outbound flight details
-    st.write(f"**Outbound:** {flight['departure']} → {flight['arrival']} ({flight['duration']})")
+    st.write(f"**Outbound:** {flight.departure} → {flight.arrival} ({flight.duration})")
     
     # Return flight details
-    st.write(f"**Return:** {flight['return_dep']} → {flight['return_arr']}")
+    st.write(f"**Return:** {flight.return_dep} → {flight.return_arr}")
     
     # Cost and stats
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Cost", f"₹{flight['cost']}")
+        st.metric("Cost", f"₹{flight.cost}")
     with col2:
-        st.metric("Cancellation", flight['cancellation'])
+        st.metric("Cancellation", flight.cancellation_label)
     with col3:
-        st.metric("Delay Risk", flight['delays'])
+        st.metric("Delay Risk", flight.delays)
     with col4:
-        st.metric("Family Rating", f"{flight['rating']}%")
+        st.metric("Family Rating", f"{flight.rating}%")
     
     # Additional info
-    st.write(f"👥 **For:** {flight['audience']}")
+    st.write(f"👥 **For:** {flight.audience}")
     
-    if flight["recommended"]:
-        st.success(f"✅ {flight['reason']}")
+    if recommendation:
+        st.success(f"✅ {recommendation['reason']}")
     
     st.divider()
 
+# --- Display Flight Cards ---
+st.subheader("Available Flights")
+st.markdown("Recommended options are highlighted for your convenience.")
+render_flight_search(("BLR", "CDG"), ("2025-04-03", "2025-04-16"), flight_itineraries, traveler_type, flight_card)
+
 st.caption("⚠️ Note: Timings, costs, cancellation rates, and ratings are simulated for demo purposes.")
@@ -7,13 +7,15 @@ Created on Fri Oct  3 22:25:47 2025
 """
 
 import streamlit as st
+from flight_page import render_flight_search
+from flight_recommender import TRAVELLER_WEIGHTS
 
 # --- Page config ---
 st.set_page_config(page_title="Flight Booking BLR → BKK", layout="wide")
 st.title("✈️ Bangalore → Bangkok Flight Booking")
 
 # --- Traveler Info ---
-traveler_type = "Family"
+traveler_type = st.sidebar.selectbox("Traveler type", list(TRAVELLER_WEIGHTS))
 travel_start = "2025-04-03"
 travel_end = "2025-04-16"
 
@@ -34,8 +36,6 @@ flight_data = [
         "delays": "Low",
         "audience": "Family Friendly",
         "rating": 80,
-        "recommended": True,
-        "reason": "Full-service carrier with vegetarian meals, in-flight entertainment, and great legroom."
     },
     {
         "carrier": "Singapore Airlines",
@@ -49,8 +49,6 @@ flight_data = [
         "delays": "Medium",
         "audience": "Luxury / Family",
         "rating": 85,
-        "recommended": True,
-        "reason": "Premium airline with excellent service, popular among families."
     },
     {
         "carrier": "IndiGo",
@@ -64,25 +62,26 @@ flight_data = [
         "delays": "Low",
         "audience": "Budget Families",
         "rating": 70,
-        "recommended": False,
-        "reason": "Budget-friendly option with basic amenities; suitable for families on a budget."
     }
 ]
 
-# --- Display Flights ---
-for flight in flight_data:
-    highlight_style = "border: 2px solid green; padding: 15px; margin-bottom: 15px; background-color: #f0fff0;" if flight["recommended"] else "border: 1px solid #ccc; padding: 15px; margin-bottom: 15px; background-color: #f9f9f9;"
+# --- Flight Cards ---
+def flight_card(flight, recommendation):
+    highlight_style = "border: 2px solid green; padding: 15px; margin-bottom: 15px; background-color: #f0fff0;" if recommendation else "border: 1px solid #ccc; padding: 15px; margin-bottom: 15px; background-color: #f9f9f9;"
     
     st.markdown(f"""
     <div style="{highlight_style} font-family: 'Segoe UI', sans-serif; color: #003366;">
-        <h3>{flight['carrier']} {"✅ Recommended" if flight['recommended'] else ""}</h3>
-        <p><b>Departure:</b> {flight['departure']} → <b>Arrival:</b> {flight['arrival']}</p>
-        <p><b>Return:</b> {flight['return_dep']} → {flight['return_arr']}</p>
-        <p><b>Duration:</b> {flight['duration']}</p>
-        <p><b>Cost:</b> ₹{flight['cost']}</p>
-        <p><b>Cancellation Rate:</b> {flight['cancellation']}</p>
-        <p><b>Delay Info:</b> {flight['delays']}</p>
-        <p><b>Audience:</b> {flight['audience']} | <b>Rating:</b> {flight['rating']}%</p>
-        {"<p><b>Reason for Recommendation:</b> " + flight['reason'] + "</p>" if flight['recommended'] else ""}
+        <h3>{flight.carrier} {"✅ Recommended" if recommendation else ""}</h3>
+        <p><b>Departure:</b> {flight.departure} → <b>Arrival:</b> {flight.arrival}</p>
+        <p><b>Return:</b> {flight.return_dep} → {flight.return_arr}</p>
+        <p><b>Duration:</b> {flight.duration}</p>
+        <p><b>Cost:</b> ₹{flight.cost}</p>
+        <p><b>Cancellation Rate:</b> {flight.cancellation_label}</p>
+        <p><b>Delay Info:</b> {flight.delays}</p>
+        <p><b>Audience:</b> {flight.audience} | <b>Rating:</b> {flight.rating}%</p>
+        {"<p><b>Reason for Recommendation:</b> " + recommendation['reason'] + "</p>" if recommendation else ""}
     </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """, unsafe_allow_html=True)
+
+# --- Display Flights ---
+render_flight_search(("BLR", "BKK"), (travel_start, travel_end), flight_data, traveler_type, flight_card)
@@ -0,0 +1,138 @@
+"""Vectorized great-circle helpers shared by the map and planning code.
+
+Distances, geodesic midpoints and great-circle arcs work on whole arrays of
+point pairs at once. ``ArcCache`` keeps simplified route polylines per
+``(origin, destination, zoom)`` so maps can draw true flight paths for free
+once they have been computed.
+"""
+import threading
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; arguments broadcast like NumPy arrays."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype=float)) for a in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_matrix(lats, lons):
+    """Pairwise distance matrix (km) between all points."""
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    return haversine_km(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+
+
+def unit_vectors(lats, lons):
+    """Points on the unit sphere, shape ``(..., 3)``."""
+    lats, lons = np.radians(np.asarray(lats, dtype=float)), np.radians(np.asarray(lons, dtype=float))
+    return np.stack([np.cos(lats) * np.cos(lons), np.cos(lats) * np.sin(lons), np.sin(lats)], axis=-1)
+
+
+def to_lat_lon(vectors):
+    """Inverse of ``unit_vectors`` (vectors need not be normalised)."""
+    x, y, z = np.moveaxis(np.asarray(vectors, dtype=float), -1, 0)
+    return np.degrees(np.arctan2(z, np.hypot(x, y))), np.degrees(np.arctan2(y, x))
+
+
+def geodesic_midpoint(lat1, lon1, lat2, lon2):
+    """Point halfway along the great circle between each pair; arguments broadcast."""
+    return to_lat_lon(unit_vectors(lat1, lon1) + unit_vectors(lat2, lon2))
+
+
+def great_circle_points(lat1, lon1, lat2, lon2, segments=64):
+    """``(lats, lons)``, each ``(pairs, segments + 1)``, along the great circle of each pair.
+
+    Longitudes are unwrapped along each arc, so a route crossing the
+    antimeridian stays one continuous line on a web map.
+    """
+    a = np.atleast_2d(unit_vectors(lat1, lon1))
+    b = np.atleast_2d(unit_vectors(lat2, lon2))
+    omega = np.arccos(np.clip((a * b).sum(axis=-1), -1.0, 1.0))[:, None]
+    t = np.linspace(0.0, 1.0, segments + 1)[None, :]
+    sin_omega = np.sin(omega)
+    # Spherical interpolation; (near-)identical endpoints fall back to linear weights
+    degenerate = sin_omega < 1e-12
+    safe = np.where(degenerate, 1.0, sin_omega)
+    wa = np.where(degenerate, 1 - t, np.sin((1 - t) * omega) / safe)
+    wb = np.where(degenerate, t, np.sin(t * omega) / safe)
+    lats, lons = to_lat_lon(wa[..., None] * a[:, None, :] + wb[..., None] * b[:, None, :])
+    return lats, np.degrees(np.unwrap(np.radians(lons), axis=1))
+
+
+def degrees_per_pixel(zoom, tile_size=256):
+    """Longitude degrees covered by one screen pixel of a web map at ``zoom``."""
+    return 360.0 / (tile_size * 2 ** zoom)
+
+
+def simplify_polyline(lats, lons, tolerance):
+    """Indices of the points kept by Ramer-Douglas-Peucker at ``tolerance``.
+
+    Distances are measured in Web Mercator degrees, so a tolerance from
+    ``degrees_per_pixel`` means the same number of pixels everywhere on the map.
+    """
+    x = np.asarray(lons, dtype=float)
+    y = np.degrees(np.log(np.tan(np.pi / 4 + np.radians(np.clip(lats, -85.0, 85.0)) / 2)))
+    keep = np.zeros(len(x), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(x) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        length = np.hypot(dx, dy)
+        distance = np.abs(dx * py - dy * px) / length if length else np.hypot(px, py)
+        farthest = int(np.argmax(distance))
+        if distance[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.extend([(start, split), (split, end)])
+    return np.flatnonzero(keep)
+
+
+class ArcCache:
+    """Simplified great-circle polylines per ``(origin, destination, zoom)``.
+
+    Polylines are sampled at ``segments`` points and simplified to
+    ``pixel_tolerance`` screen pixels at the requested zoom. Misses are computed
+    together in one vectorized batch. Safe to share between sessions.
+    """
+
+    def __init__(self, segments=64, pixel_tolerance=1.0, max_entries=50_000):
+        self.segments = segments
+        self.pixel_tolerance = pixel_tolerance
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._arcs = {}
+        self._lock = threading.Lock()
+
+    def arcs(self, origin, lats, lons, zoom):
+        """``[[lat, lon], ...]`` from ``origin`` to each ``(lats[i], lons[i])``, in order."""
+        lats, lons = np.asarray(lats, dtype=float), np.asarray(lons, dtype=float)
+        keys = [(round(origin[0], 5), round(origin[1], 5), round(lat, 5), round(lon, 5), zoom)
+                for lat, lon in zip(lats.tolist(), lons.tolist())]
+        with self._lock:
+            found = [self._arcs.get(key) for key in keys]
+        missing = [i for i, arc in enumerate(found) if arc is None]
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if not missing:
+            return found
+
+        arc_lats, arc_lons = great_circle_points(origin[0], origin[1], lats[missing], lons[missing], self.segments)
+        tolerance = degrees_per_pixel(zoom) * self.pixel_tolerance
+        for row, i in enumerate(missing):
+            kept = simplify_polyline(arc_lats[row], arc_lons[row], tolerance)
+            found[i] = np.column_stack([arc_lats[row, kept], arc_lons[row, kept]]).round(5).tolist()
+        with self._lock:
+            for i in missing:
+                self._arcs[keys[i]] = found[i]
+            while len(self._arcs) > self.max_entries:
+                self._arcs.pop(next(iter(self._arcs)))
+        return found
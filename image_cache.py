@@ -0,0 +1,139 @@
+"""Display-size image derivatives for the swipe deck.
+
+Originals in ``images/`` are decoded once and written to an on-disk cache as
+WebP (JPEG if Pillow was built without WebP) at a few fixed widths. Cache
+entries are keyed by source path + mtime, so replacing a photo invalidates its
+derivatives automatically. Pages read the encoded derivative bytes through a
+memoized loader and never decode an original on a rerun.
+
+``PhotoPrefetcher`` stages the photos of the next few cards on a small shared
+thread pool while the user is still looking at the current one.
+"""
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import profiling
+
+# --- Settings ---
+DERIVATIVE_WIDTHS = (480, 960, 1200)
+CACHE_DIR = Path(os.environ.get("SWIPESCAPES_IMAGE_CACHE", ".image_cache"))
+QUALITY = 82
+PREFETCH_WORKERS = 2
+
+
+@lru_cache(maxsize=None)
+def derivative_format():
+    """WEBP, or JPEG if Pillow was built without WebP; Pillow is imported on first use."""
+    from PIL import features
+
+    return "WEBP" if features.check("webp") else "JPEG"
+
+
+def pick_width(display_width, density=2):
+    """Smallest derivative width that stays sharp at the given display width."""
+    wanted = display_width * density
+    for width in DERIVATIVE_WIDTHS:
+        if width >= wanted:
+            return width
+    return DERIVATIVE_WIDTHS[-1]
+
+
+def derivative_path(source, width, mtime_ns=None):
+    """Cache location of one derivative of ``source``."""
+    source = Path(source)
+    if mtime_ns is None:
+        mtime_ns = source.stat().st_mtime_ns
+    fmt = derivative_format()
+    key = f"{source.resolve()}:{mtime_ns}:{width}:{fmt}:{QUALITY}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    suffix = ".webp" if fmt == "WEBP" else ".jpg"
+    return CACHE_DIR / f"{source.stem}-{width}-{digest}{suffix}"
+
+
+@profiling.section("photo derivatives")
+def build_derivatives(source, widths=DERIVATIVE_WIDTHS):
+    """Write every missing derivative of ``source``; the original is decoded at most once."""
+    source = Path(source)
+    mtime_ns = source.stat().st_mtime_ns
+    targets = {width: derivative_path(source, width, mtime_ns) for width in widths}
+    missing = {width: path for width, path in targets.items() if not path.exists()}
+    if not missing:
+        return targets
+
+    from PIL import Image
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with Image.open(source) as img:
+        img = img.convert("RGB")
+        for width, path in missing.items():
+            derivative = img
+            if img.width > width:
+                height = int((width / img.width) * img.height)
+                derivative = img.resize((width, height), Image.Resampling.LANCZOS)
+            # Write to a per-thread temp file and rename, so concurrent builds and readers never see a partial file
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            derivative.save(tmp_path, derivative_format(), quality=QUALITY)
+            os.replace(tmp_path, path)
+    return targets
+
+
+@lru_cache(maxsize=256)
+def _load_derivative(source, mtime_ns, width):
+    path = derivative_path(source, width, mtime_ns)
+    if not path.exists():
+        build_derivatives(source)
+    return path.read_bytes()
+
+
+def load_display_image(source, display_width=450):
+    """Encoded derivative bytes for showing ``source`` at ``display_width`` pixels."""
+    source = Path(source)
+    mtime_ns = source.stat().st_mtime_ns
+    return _load_derivative(str(source), mtime_ns, pick_width(display_width))
+
+
+# --- Prefetch ---
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _prefetch_executor():
+    """Process-wide pool shared by every session, so prefetch load stays bounded."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="photo-prefetch")
+        return _executor
+
+
+class PhotoPrefetcher:
+    """Stages the photos of upcoming swipe cards in the background for one session."""
+
+    def __init__(self, display_width=450):
+        self.display_width = display_width
+        self._staged = {}
+
+    def prefetch(self, paths):
+        """Start loading every path that is not staged yet."""
+        for path in paths:
+            key = str(path)
+            if key not in self._staged and Path(path).exists():
+                self._staged[key] = _prefetch_executor().submit(load_display_image, path, self.display_width)
+
+    def retain(self, paths):
+        """Evict staged photos that are no longer in ``paths`` (cards swiped past or filtered out)."""
+        keep = {str(path) for path in paths}
+        for key in list(self._staged):
+            if key not in keep:
+                self._staged.pop(key).cancel()
+
+    def get(self, path):
+        """Staged bytes for ``path``, loading synchronously if it was never prefetched."""
+        future = self._staged.get(str(path))
+        if future is None:
+            return load_display_image(path, self.display_width)
+        return future.result()
@@ -0,0 +1,307 @@
+"""SwipeScapes itinerary planner for every city in ``cities/``.
+
+Run it directly (``streamlit run itinerary_app.py``) and pick the city with
+``?city=<slug>`` or the sidebar; ``SWIPESCAPES_DEFAULT_CITY`` sets the city
+shown when none is given. ``iten.py`` and ``itenbkk.py`` are thin entry points
+that open Paris and Bangkok.
+"""
+import os
+
+import streamlit as st
+import profiling
+from city_catalog import list_cities, load_city
+from itinerary_export import EXPORT_FORMATS, ItineraryExporter, content_key, export_rows
+from itinerary_map import build_itinerary_map
+from map_embed import embed_map
+from itinerary_scheduler import MEAL_DURATION, TravelModel
+from restaurant_recommender import RestaurantIndex, PRICE_LEVELS, apply_meal_choices, find_meal_gaps
+from static_assets import stylesheet
+from tile_server import map_tiles
+
+DEFAULT_CITY = os.environ.get("SWIPESCAPES_DEFAULT_CITY", "paris")
+RECOMMENDATIONS_SHOWN = 5
+
+FOOTER_HTML = """
+<div style='text-align: center; color: #666; margin-top: 20px;'>
+    <p>Made with ❤️ by SwipeScapes</p>
+    <p style='font-size: 12px;'>Your personalized travel companion powered by AI & Geospatial Tech</p>
+</div>
+"""
+
+
+def get_duration(catalog, item_name):
+    """Get duration for attraction or restaurant."""
+    if item_name in catalog["attractions"]:
+        return catalog["attractions"][item_name].duration
+    return MEAL_DURATION
+
+@st.cache_resource
+def get_travel_model(version, _attractions, _restaurants):
+    """Travel-time matrix for a city catalog, built once per process and catalog version."""
+    return TravelModel(_attractions, _restaurants)
+
+@st.cache_resource
+def get_restaurant_index(version, _restaurants):
+    """Spatial index over a city's restaurants, built once per process and catalog version."""
+    return RestaurantIndex(_restaurants)
+
+def legend_text_color(background):
+    """Black on light day colors, white on dark ones."""
+    red, green, blue = (int(background.lstrip("#")[i:i + 2], 16) for i in (0, 2, 4))
+    return "black" if 0.299 * red + 0.587 * green + 0.114 * blue > 186 else "white"
+
+@profiling.section("day table")
+def display_day_itinerary(catalog, day_name, day_data, schedule):
+    """Display itinerary for a single day."""
+    with st.container():
+        st.markdown(f"<div class='day-header'><h2>{day_data['theme']}</h2><p>{day_data['date']}</p></div>", unsafe_allow_html=True)
+
+        # Create dataframe from the computed schedule
+        data = []
+        for row in schedule:
+            name = row['name']
+
+            if row['type'] == 'restaurant':
+                category = "🍽️ Restaurant"
+            else:
+                category = f"📍 {catalog['attractions'][name].category}"
+
+            data.append({
+                "⏰ Time": f"{row['start']} - {row['end']}",
+                "📍 Location": name,
+                "⏳ Duration": f"{row['duration']} min",
+                "🚗 Travel": f"{row['travel_min']} min" if row['travel_min'] else "—",
+                "🏷️ Type": category
+            })
+
+        # A list of row dicts renders without importing pandas
+        st.dataframe(data, use_container_width=True, hide_index=True)
+
+        return data
+
+def create_map_with_routes(catalog, itinerary):
+    """Create interactive map with all routes, generated from the itinerary."""
+    places = {**catalog["restaurants"], **catalog["attractions"]}
+    tiles, attr = map_tiles("osm", "OpenStreetMap", "&copy; OpenStreetMap contributors")
+    return build_itinerary_map(itinerary, places, tuple(catalog["center"]),
+                               zoom_start=catalog["zoom_start"], tiles=tiles, attr=attr)
+
+@st.fragment
+def itinerary_map(catalog, itinerary):
+    """Route map; a click reruns only this fragment to show the clicked stop."""
+    with profiling.section("map build"):
+        m = create_map_with_routes(catalog, itinerary)
+    with profiling.section("map embed"):
+        state = embed_map(m, events="click", key="itinerary_map", width=1400, height=600)
+    if state and state.get("last_object_clicked_popup"):
+        st.caption(f"📍 {state['last_object_clicked_popup'].strip()}")
+
+@st.cache_resource
+def get_exporter():
+    """Export worker pool and file cache shared by all sessions."""
+    return ItineraryExporter()
+
+@st.fragment(run_every=0.5)
+def export_progress(job):
+    """Poll a running export; hand over to a full rerun once the file is ready."""
+    if job.done():
+        st.rerun()
+    st.progress(job.progress, text=f"Preparing {job.fmt} export... {job.progress:.0%}")
+
+def export_panel(rows_by_day, file_stem):
+    """Format picker, background export and download button."""
+    fmt = st.radio("Format", list(EXPORT_FORMATS), horizontal=True, key="export_format")
+    spec = EXPORT_FORMATS[fmt]
+    exporter = get_exporter()
+    key = content_key(rows_by_day)
+    data = exporter.cached(fmt, key)
+
+    if data is None:
+        job = st.session_state.get("export_job")
+        if st.button(f"📥 Download as {fmt}", use_container_width=True):
+            job = st.session_state.export_job = exporter.submit(fmt, rows_by_day, key)
+        if job is not None and (job.fmt, job.key) == (fmt, key):
+            if not job.done():
+                export_progress(job)
+            elif job.future.exception():
+                st.error(f"⚠️ Export failed: {job.future.exception()}")
+            else:
+                data = job.result()
+
+    if data is not None:
+        st.download_button(
+            label=f"Download {fmt} File",
+            data=data,
+            file_name=f"{file_stem}.{spec['extension']}",
+            mime=spec["mime"],
+            use_container_width=True
+        )
+
+def select_city(default_city):
+    """City slug from the sidebar, seeded from ``?city=`` and kept in the URL."""
+    cities = list_cities()
+    if st.session_state.get("city") not in cities:
+        requested = st.query_params.get("city", default_city)
+        st.session_state.city = requested if requested in cities else next(iter(cities))
+    slug = st.sidebar.selectbox("🌍 City", list(cities), format_func=cities.get, key="city")
+    st.query_params["city"] = slug
+    return slug
+
+def main(default_city=DEFAULT_CITY):
+    slug = select_city(default_city)
+    profiling.begin_rerun(f"itinerary:{slug}")
+    catalog = load_city(slug)
+    city = catalog["name"]
+    itinerary = catalog["itinerary"]
+    attractions, restaurants = catalog["attractions"], catalog["restaurants"]
+    trip_days = len(itinerary)
+
+    # Set page config for better performance
+    st.set_page_config(
+        page_title=f"SwipeScapes - {city} Itinerary",
+        page_icon="✈️",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(stylesheet("itinerary"), unsafe_allow_html=True)
+
+    # Main app
+    st.title(f"✈️ SwipeScapes - {city} {trip_days}-Day Itinerary")
+    st.markdown("---")
+
+    # Back button
+    col_back = st.columns([5, 1])
+    with col_back[1]:
+        if st.button("← Back to Website", use_container_width=True):
+            st.info("Redirecting to SwipeScapes website...")
+            st.markdown("<meta http-equiv='refresh' content='1;url=https://swipescapes.com'>", unsafe_allow_html=True)
+
+    # Create tabs
+    # Rerun on tab switch so the map (and folium) is only built while its tab is open
+    tab1, tab2, tab3 = st.tabs(["📋 Itinerary", "🗺️ Map", "💾 Export"], key="itinerary_tab", on_change="rerun")
+
+    with tab1:
+        st.header(f"Your Personalized {city} Trip")
+
+        travel_model = get_travel_model(catalog["version"], attractions, restaurants)
+        restaurant_index = get_restaurant_index(catalog["version"], restaurants)
+        places = {**restaurants, **attractions}
+
+        # Meal gaps come from the base plan; restaurants picked below are slotted into them
+        base_schedules = travel_model.schedule_itinerary(itinerary)
+        meal_gaps = [gap for day_name, day_data in itinerary.items()
+                     for gap in find_meal_gaps(day_name, day_data, base_schedules[day_name])]
+
+        # Filter and choice keys are per city, so switching cities never carries over stale options
+        cuisine_filter = st.session_state.get(f"meal_cuisines_{slug}", [])
+        max_price = st.session_state.get(f"meal_max_price_{slug}", list(PRICE_LEVELS)[-1])
+        min_stars = st.session_state.get(f"meal_min_stars_{slug}", 1)
+
+        # Rank restaurants for every gap up front so the plan only ever holds a currently offered choice
+        recommendations = {}
+        meal_choices = {}
+        for gap in meal_gaps:
+            anchors = [(places[name].lat, places[name].lon) for name in gap["anchors"]]
+            already_planned = [stop["name"] for stop in itinerary[gap["day"]]["stops"]]
+            recs = restaurant_index.nearest(anchors, k=RECOMMENDATIONS_SHOWN, cuisines=cuisine_filter,
+                                            max_price=max_price, min_stars=min_stars, exclude=already_planned)
+            choice_key = f"meal_{slug}_{gap['day']}_{gap['meal']}"
+            if st.session_state.get(choice_key) not in [rec["name"] for rec in recs]:
+                st.session_state.pop(choice_key, None)
+            recommendations[choice_key] = recs
+            meal_choices[(gap["day"], gap["meal"])] = st.session_state.get(choice_key)
+        planned_itinerary = apply_meal_choices(itinerary, meal_gaps, meal_choices)
+
+        # Start/end times follow from durations plus travel between stops
+        schedules = travel_model.schedule_itinerary(planned_itinerary)
+
+        # Display all days
+        for day_name, day_data in planned_itinerary.items():
+            display_day_itinerary(catalog, day_name, day_data, schedules[day_name])
+
+        # Meal gap alerts with the nearest matching restaurants
+        if meal_gaps:
+            st.markdown("---")
+            filter_col1, filter_col2, filter_col3 = st.columns(3)
+            with filter_col1:
+                st.multiselect("🍽️ Cuisine", restaurant_index.cuisines, key=f"meal_cuisines_{slug}")
+            with filter_col2:
+                st.select_slider("💰 Max price", options=list(PRICE_LEVELS), value=max_price, key=f"meal_max_price_{slug}")
+            with filter_col3:
+                st.slider("⭐ Min stars", 1, 5, min_stars, key=f"meal_min_stars_{slug}")
+
+        for gap in meal_gaps:
+            day_name, meal = gap["day"], gap["meal"]
+            st.markdown(f"<div class='meal-warning'><h3>⚠️ Missing {meal} on {day_name}</h3><p>Your {day_name} itinerary is missing {meal.lower()}. Would you like to add a restaurant?</p></div>", unsafe_allow_html=True)
+
+            choice_key = f"meal_{slug}_{day_name}_{meal}"
+            recs = recommendations[choice_key]
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"<h4>Recommended Restaurants near {' & '.join(gap['anchors'])}:</h4>", unsafe_allow_html=True)
+                if not recs:
+                    st.info("No restaurants match your filters.")
+                else:
+                    details = {rec["name"]: rec for rec in recs}
+                    st.radio(
+                        f"{meal} on {day_name}",
+                        list(details),
+                        index=None,
+                        key=choice_key,
+                        label_visibility="collapsed",
+                        format_func=lambda name, details=details: (
+                            f"{name} · 🍽️ {details[name]['cuisine']} · 💰 {details[name]['price']}"
+                            f" · ⭐ {details[name]['stars']} · 📍 {details[name]['distance_km']:.1f} km"
+                        ),
+                    )
+
+            chosen = meal_choices[(day_name, meal)]
+            if chosen:
+                stops = planned_itinerary[day_name]["stops"]
+                position = next(i for i, stop in enumerate(stops) if stop.get("meal") == meal)
+                st.success(f"✅ Added {chosen} to {day_name} {meal.lower()} at {schedules[day_name][position]['start']}!")
+
+    with tab2:
+        st.header(f"{city} Itinerary Routes")
+        st.markdown("**Route Colors:**")
+        for col, (day_name, day_data) in zip(st.columns(trip_days), itinerary.items()):
+            with col:
+                label = day_data.get("label", day_data["theme"])
+                st.markdown(f"<div style='background-color: {day_data['color']}; padding: 10px; border-radius: 5px; color: {legend_text_color(day_data['color'])}; text-align: center;'><b>{day_name}: {label}</b></div>", unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        if tab2.open:
+            itinerary_map(catalog, planned_itinerary)
+
+    with tab3:
+        st.header("Export Your Itinerary")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            export_panel(export_rows(planned_itinerary, schedules), f"{city}_{trip_days}Day_Itinerary")
+
+        with col2:
+            if st.button("📊 View Summary", use_container_width=True):
+                st.write("### Trip Summary")
+
+                total_attractions = sum(len([s for s in day["stops"] if s["type"] == "attraction"]) for day in planned_itinerary.values())
+                total_meals = sum(len([s for s in day["stops"] if s["type"] == "restaurant"]) for day in planned_itinerary.values())
+
+                total_duration = sum(get_duration(catalog, s["name"]) for day in planned_itinerary.values() for s in day["stops"])
+
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("📍 Total Days", str(trip_days))
+                col2.metric("🏛️ Attractions", total_attractions)
+                col3.metric("🍽️ Meals", total_meals)
+                col4.metric("⏱️ Total Hours", f"{total_duration // 60}h {total_duration % 60}m")
+
+    # Footer
+    st.markdown("---")
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
+    profiling.render_panel()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Itinerary export to Excel, CSV and Parquet.
+
+Rows are streamed straight from the computed schedules into each writer (a
+write-only openpyxl workbook, ``csv.writer``, Parquet row groups) without
+building DataFrames first. Generated files are cached by a content hash of the
+itinerary and built on a small worker pool, so a large export never blocks a
+session's rerun and identical exports are only generated once per process.
+"""
+import csv
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+EXPORT_FORMATS = {
+    "Excel": {"extension": "xlsx", "mime": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"},
+    "CSV": {"extension": "csv", "mime": "text/csv"},
+    "Parquet": {"extension": "parquet", "mime": "application/vnd.apache.parquet"},
+}
+COLUMNS = ["Day", "Date", "Start", "End", "Location", "Type", "Duration (min)", "Travel (min)"]
+PARQUET_BATCH_ROWS = 10_000
+
+
+def export_rows(itinerary, schedules):
+    """``{day: [row, ...]}`` in ``COLUMNS`` order."""
+    return {
+        day_name: [
+            [day_name, itinerary[day_name].get("date", ""), row["start"], row["end"], row["name"],
+             row["type"], row["duration"], row["travel_min"]]
+            for row in schedules[day_name]
+        ]
+        for day_name in schedules
+    }
+
+
+def content_key(rows_by_day):
+    """Stable hash of the exported content."""
+    payload = json.dumps(rows_by_day, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExportJob:
+    """A running or finished export; ``progress`` goes from 0.0 to 1.0."""
+
+    def __init__(self, fmt, key):
+        self.fmt = fmt
+        self.key = key
+        self.progress = 0.0
+        self.future = None
+
+    def done(self):
+        return self.future.done()
+
+    def result(self):
+        return self.future.result()
+
+
+def _write_xlsx(rows_by_day, out, tick):
+    from openpyxl import Workbook
+
+    # Write-only workbooks stream rows to disk instead of keeping a cell grid in memory
+    workbook = Workbook(write_only=True)
+    for day_name, rows in rows_by_day.items():
+        sheet = workbook.create_sheet(title=day_name[:31])
+        sheet.append(COLUMNS)
+        for row in rows:
+            sheet.append(row)
+            tick()
+    workbook.save(out)
+
+
+def _write_csv(rows_by_day, out, tick):
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="", write_through=True)
+    writer = csv.writer(text)
+    writer.writerow(COLUMNS)
+    for rows in rows_by_day.values():
+        for row in rows:
+            writer.writerow(row)
+            tick()
+    text.detach()
+
+
+def _write_parquet(rows_by_day, out, tick):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, pa.int64() if name.endswith("(min)") else pa.string()) for name in COLUMNS])
+    with pq.ParquetWriter(out, schema) as writer:
+        batch = []
+        for rows in rows_by_day.values():
+            for row in rows:
+                batch.append(row)
+                tick()
+                if len(batch) >= PARQUET_BATCH_ROWS:
+                    writer.write_table(pa.Table.from_pylist([dict(zip(COLUMNS, r)) for r in batch], schema))
+                    batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist([dict(zip(COLUMNS, r)) for r in batch], schema))
+
+
+WRITERS = {"Excel": _write_xlsx, "CSV": _write_csv, "Parquet": _write_parquet}
+
+
+class ItineraryExporter:
+    """Process-wide export service: worker pool, in-flight jobs and a bytes cache."""
+
+    def __init__(self, max_workers=2, cache_entries=32):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="itinerary-export")
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._cache = OrderedDict()
+        self.cache_entries = cache_entries
+
+    def cached(self, fmt, key):
+        """Finished export bytes, or ``None``."""
+        with self._lock:
+            data = self._cache.get((fmt, key))
+            if data is not None:
+                self._cache.move_to_end((fmt, key))
+            return data
+
+    def submit(self, fmt, rows_by_day, key=None):
+        """Start (or join) the export of ``rows_by_day`` in ``fmt``; returns an ``ExportJob``."""
+        key = key or content_key(rows_by_day)
+        with self._lock:
+            job = self._jobs.get((fmt, key))
+            if job is not None and not (job.done() and job.future.exception()):
+                return job
+            job = ExportJob(fmt, key)
+            job.future = self._executor.submit(self._run, job, rows_by_day)
+            self._jobs[(fmt, key)] = job
+            return job
+
+    def _run(self, job, rows_by_day):
+        cached = self.cached(job.fmt, job.key)
+        if cached is not None:
+            job.progress = 1.0
+            return cached
+
+        total = max(sum(len(rows) for rows in rows_by_day.values()), 1)
+        written = 0
+
+        def tick():
+            nonlocal written
+            written += 1
+            job.progress = min(written / total, 0.99)
+
+        out = io.BytesIO()
+        WRITERS[job.fmt](rows_by_day, out, tick)
+        data = out.getvalue()
+        with self._lock:
+            self._cache[(job.fmt, job.key)] = data
+            while len(self._cache) > self.cache_entries:
+                evicted = self._cache.popitem(last=False)[0]
+                self._jobs.pop(evicted, None)
+        job.progress = 1.0
+        return data
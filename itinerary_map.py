@@ -0,0 +1,61 @@
+"""Itinerary map layers generated from ``ITINERARY`` data.
+
+Each day becomes one GeoJSON FeatureCollection (a route LineString plus one
+Point per stop) in its own FeatureGroup, styled from the day's colour in the
+feature properties. The map always matches the plan, including restaurants
+added for meal gaps, and the page ships one compact layer per day instead of
+a separate folium object per stop.
+
+folium is imported inside ``build_itinerary_map`` so pages only pay for it when
+a map is actually drawn.
+"""
+
+
+def day_feature_collection(day_name, day, places):
+    """GeoJSON for one day: the route and its numbered stops."""
+    coords = [[places[stop["name"]].lon, places[stop["name"]].lat] for stop in day["stops"]]
+    features = []
+    if len(coords) > 1:
+        features.append({
+            "type": "Feature",
+            "id": f"{day_name}-route",
+            "geometry": {"type": "LineString", "coordinates": coords},
+            "properties": {"kind": "route", "color": day["color"], "label": day_name},
+        })
+    for idx, (stop, point) in enumerate(zip(day["stops"], coords), 1):
+        features.append({
+            "type": "Feature",
+            "id": f"{day_name}-{idx}",
+            "geometry": {"type": "Point", "coordinates": point},
+            "properties": {
+                "kind": stop["type"],
+                "color": day["color"],
+                "label": f"{day_name} - Stop {idx}: {stop['name']}",
+            },
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _style(feature):
+    props = feature["properties"]
+    if props["kind"] == "route":
+        return {"color": props["color"], "weight": 4, "opacity": 0.8}
+    return {"color": props["color"], "fillColor": props["color"], "fillOpacity": 0.8, "radius": 8}
+
+
+def build_itinerary_map(itinerary, places, center, zoom_start=12, tiles="OpenStreetMap", attr=None):
+    """Folium map with one FeatureGroup of GeoJSON per itinerary day."""
+    import folium
+
+    m = folium.Map(location=list(center), zoom_start=zoom_start, tiles=tiles, attr=attr)
+    for day_name, day in itinerary.items():
+        group = folium.FeatureGroup(name=f"{day_name}: {day['theme']}")
+        folium.GeoJson(
+            day_feature_collection(day_name, day, places),
+            style_function=_style,
+            marker=folium.CircleMarker(fill=True),
+            popup=folium.GeoJsonPopup(fields=["label"], labels=False),
+        ).add_to(group)
+        group.add_to(m)
+    folium.LayerControl(collapsed=False).add_to(m)
+    return m
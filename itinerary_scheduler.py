@@ -0,0 +1,98 @@
+"""Travel-time-aware scheduling of itinerary days.
+
+Start and end times are derived from each stop's duration plus the travel time
+to the next stop, instead of being hardcoded. Travel times come from a haversine
+distance matrix over the whole attraction/restaurant catalog, computed once, so
+rescheduling a multi-day plan is a handful of NumPy operations.
+"""
+import numpy as np
+
+from geo import haversine_matrix
+
+DEFAULT_DAY_START = "09:00"
+MEAL_DURATION = 60  # Default meal time (minutes)
+CITY_SPEED_KMH = 18  # Average door-to-door speed across town
+DETOUR_FACTOR = 1.3  # Street distance vs straight line
+MIN_TRANSFER_MIN = 10
+ROUND_TO_MIN = 5
+
+
+def to_minutes(clock):
+    """``"HH:MM"`` to minutes after midnight."""
+    hours, minutes = clock.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def to_clock(minutes):
+    """Minutes after midnight to ``"HH:MM"`` (wraps past midnight)."""
+    minutes = int(minutes) % (24 * 60)
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class TravelModel:
+    """Catalog coordinates, durations and the precomputed travel-time matrix.
+
+    ``attractions`` and ``restaurants`` map names to ``records.Attraction`` /
+    ``records.Restaurant``.
+    """
+
+    def __init__(self, attractions, restaurants, speed_kmh=CITY_SPEED_KMH):
+        self.names = list(attractions) + [name for name in restaurants if name not in attractions]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        places = {**restaurants, **attractions}
+        lats = np.array([places[name].lat for name in self.names], dtype=float)
+        lons = np.array([places[name].lon for name in self.names], dtype=float)
+        self.durations = np.array(
+            [attractions[name].duration if name in attractions else MEAL_DURATION for name in self.names],
+            dtype=np.int64,
+        )
+        self.distance_km = haversine_matrix(lats, lons)
+        minutes = self.distance_km * DETOUR_FACTOR / speed_kmh * 60
+        minutes = np.ceil(np.maximum(minutes, MIN_TRANSFER_MIN) / ROUND_TO_MIN) * ROUND_TO_MIN
+        np.fill_diagonal(minutes, 0)
+        self.travel_min = minutes.astype(np.int64)
+
+    def schedule_day(self, stops, day_start=DEFAULT_DAY_START):
+        """Rows with start/end times, duration and travel time from the previous stop.
+
+        A stop may carry ``"not_before": "HH:MM"`` (e.g. a meal); later stops
+        then shift accordingly. Everything else follows from durations and travel.
+        """
+        if not stops:
+            return []
+        idx = np.fromiter((self.index[stop["name"]] for stop in stops), dtype=np.int64, count=len(stops))
+        durations = self.durations[idx]
+        travel = np.zeros(len(stops), dtype=np.int64)
+        travel[1:] = self.travel_min[idx[:-1], idx[1:]]
+        distance = np.zeros(len(stops))
+        distance[1:] = self.distance_km[idx[:-1], idx[1:]]
+
+        # Earliest start of each stop if nothing waited: day start + everything before it
+        offsets = to_minutes(day_start) + np.concatenate(([0], np.cumsum(durations[:-1] + travel[1:])))
+        not_before = np.array(
+            [to_minutes(stop["not_before"]) if stop.get("not_before") else -10**9 for stop in stops],
+            dtype=np.int64,
+        )
+        # s[i] = max(not_before[i], s[i-1] + duration[i-1] + travel[i]) in closed form
+        starts = offsets + np.maximum.accumulate(np.maximum(not_before - offsets, 0))
+        ends = starts + durations
+
+        return [
+            {
+                "name": stop["name"],
+                "type": stop["type"],
+                "start": to_clock(start),
+                "end": to_clock(end),
+                "duration": int(duration),
+                "travel_min": int(leg),
+                "travel_km": float(km),
+            }
+            for stop, start, end, duration, leg, km in zip(stops, starts, ends, durations, travel, distance)
+        ]
+
+    def schedule_itinerary(self, itinerary):
+        """Schedule every day of an ``ITINERARY``-shaped dict."""
+        return {
+            day_name: self.schedule_day(day["stops"], day.get("start", DEFAULT_DAY_START))
+            for day_name, day in itinerary.items()
+        }
@@ -0,0 +1,50 @@
+"""Embedding folium maps with only the interactivity a page declares.
+
+``st_folium`` returns every map event by default, so each pan, zoom or click
+reruns the whole script even when the page never reads the result. Callers of
+``embed_map`` declare the events they use instead:
+
+* none (the default) - the map is static pre-built HTML in an iframe;
+  panning, zooming and clicking stay in the browser and never rerun anything.
+* ``"click"`` - only the last click (and clicked object) is sent back, so a
+  click reruns but pans and zooms don't.
+* ``"bounds"`` - the current view (bounds, zoom and center) is sent back, so
+  every pan and zoom reruns.
+
+Interactive maps are best embedded inside an ``st.fragment`` so those reruns
+stay local to the map.
+"""
+import streamlit as st
+
+MAP_EVENTS = {
+    "click": ("last_clicked", "last_object_clicked", "last_object_clicked_tooltip", "last_object_clicked_popup"),
+    "bounds": ("bounds", "zoom", "center"),
+}
+
+
+def returned_objects(events):
+    """``st_folium`` return keys for the declared ``events``."""
+    unknown = set(events) - set(MAP_EVENTS)
+    if unknown:
+        raise ValueError(f"Unknown map events: {', '.join(sorted(unknown))} (expected {', '.join(MAP_EVENTS)})")
+    return [name for event in MAP_EVENTS if event in events for name in MAP_EVENTS[event]]
+
+
+def embed_map(m, events=(), key=None, width=None, height=600):
+    """Show a folium map (or, for static maps, its rendered HTML or URL) with just the declared ``events``.
+
+    Returns ``None`` for a static map, else ``st_folium``'s dict limited to the
+    declared events' keys. ``width=None`` fills the container.
+    """
+    if isinstance(events, str):
+        events = (events,)
+    if not events:
+        html = m if isinstance(m, str) else m.get_root().render()
+        return st.iframe(html, width=width or "stretch", height=height)
+
+    if isinstance(m, str):
+        raise TypeError("Interactive maps need the folium object, not rendered HTML or a URL")
+    from streamlit_folium import st_folium
+
+    return st_folium(m, key=key, width=width, height=height, use_container_width=width is None,
+                     returned_objects=returned_objects(events))
@@ -0,0 +1,212 @@
+"""Persistent post store behind the community feed.
+
+``PostStore`` is the interface the feed talks to; ``SQLitePostStore`` implements
+it on one WAL-mode SQLite file, so posts, reactions and comments are shared by
+every session and survive restarts. Another engine only has to implement the
+same methods.
+"""
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from records import Post
+
+DB_PATH = os.environ.get("SWIPESCAPES_COMMUNITY_DB", "community.db")
+COUNTER_FIELDS = ("likes", "useful", "not_useful")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    destination TEXT NOT NULL,
+    user TEXT NOT NULL,
+    content TEXT NOT NULL,
+    type TEXT NOT NULL,
+    likes INTEGER NOT NULL DEFAULT 0,
+    useful INTEGER NOT NULL DEFAULT 0,
+    not_useful INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_posts_destination_time
+    ON posts (destination, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_posts_destination_type_time
+    ON posts (destination, type, created_at DESC, id DESC);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id INTEGER NOT NULL REFERENCES posts (id),
+    body TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_comments_post_time
+    ON comments (post_id, created_at, id);
+"""
+
+
+def page_cursor(post):
+    """Cursor that continues a feed after ``post``."""
+    return (post.created_at, post.id)
+
+
+def format_age(created_at, now=None):
+    """Relative age label shown on a post card, e.g. ``5h ago`` or ``2d ago``."""
+    hours = int(((now or time.time()) - created_at) // 3600)
+    if hours < 1:
+        return "just now"
+    return f"{hours}h ago" if hours < 24 else f"{hours // 24}d ago"
+
+
+class PostStore(ABC):
+    """Storage operations needed by the community feed."""
+
+    @abstractmethod
+    def add_post(self, destination, user, content, post_type, likes=0, useful=0, not_useful=0, created_at=None):
+        """Insert a post and return its id."""
+
+    @abstractmethod
+    def list_posts(self, destination, post_type=None, limit=20, before=None):
+        """One page of a destination's posts (optionally one type) as ``records.Post``, newest first.
+
+        ``before`` is the cursor of the last post on the previous page, as
+        returned by ``page_cursor``; comments are not included.
+        """
+
+    @abstractmethod
+    def count_posts(self, destination):
+        """Number of posts stored for a destination."""
+
+    @abstractmethod
+    def increment(self, post_id, field, amount=1):
+        """Atomically add ``amount`` to one of ``COUNTER_FIELDS`` of a post."""
+
+    @abstractmethod
+    def get_counts(self, post_id):
+        """Current ``COUNTER_FIELDS`` values of a post."""
+
+    def increment_many(self, deltas):
+        """Apply ``{(post_id, field): amount}`` counter deltas; engines should do it in one transaction."""
+        for (post_id, field), amount in deltas.items():
+            self.increment(post_id, field, amount)
+
+    @abstractmethod
+    def add_comment(self, post_id, body, created_at=None):
+        """Append a comment to a post."""
+
+    @abstractmethod
+    def list_comments(self, post_id, limit=50):
+        """Up to ``limit`` of the newest comment bodies of a post, oldest first."""
+
+    def seed(self, destination, posts):
+        """Load ``posts`` for a destination the first time the store is empty for it."""
+        if self.count_posts(destination):
+            return
+        now = time.time()
+        for post in posts:
+            created_at = now - post.get("hours_ago", 0) * 3600
+            post_id = self.add_post(
+                destination, post["user"], post["content"], post["type"],
+                likes=post.get("likes", 0), useful=post.get("useful", 0),
+                not_useful=post.get("not_useful", 0), created_at=created_at,
+            )
+            for body in post.get("comments", []):
+                self.add_comment(post_id, body, created_at=created_at)
+
+
+class SQLitePostStore(PostStore):
+    """``PostStore`` on a single SQLite file in WAL mode.
+
+    One connection is opened per store and reused across reruns and sessions;
+    a lock serialises access to it, and WAL lets other processes keep reading
+    while one of them writes.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add_post(self, destination, user, content, post_type, likes=0, useful=0, not_useful=0, created_at=None):
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO posts (destination, user, content, type, likes, useful, not_useful, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (destination, user, content, post_type, likes, useful, not_useful, created_at or time.time()),
+            )
+            return cursor.lastrowid
+
+    def list_posts(self, destination, post_type=None, limit=20, before=None):
+        query = "SELECT * FROM posts WHERE destination = ?"
+        params = [destination]
+        if post_type is not None:
+            query += " AND type = ?"
+            params.append(post_type)
+        if before is not None:
+            # Keyset pagination: seeks straight into the (destination, created_at, id) index
+            query += " AND (created_at, id) < (?, ?)"
+            params.extend(before)
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [Post(**row) for row in rows]
+
+    def count_posts(self, destination):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM posts WHERE destination = ?", (destination,)
+            ).fetchone()[0]
+
+    def increment(self, post_id, field, amount=1):
+        if field not in COUNTER_FIELDS:
+            raise ValueError(f"Unknown counter field: {field!r}")
+        with self._lock:
+            self._conn.execute(f"UPDATE posts SET {field} = {field} + ? WHERE id = ?", (amount, post_id))
+
+    def get_counts(self, post_id):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(COUNTER_FIELDS)} FROM posts WHERE id = ?", (post_id,)
+            ).fetchone()
+        return dict(row) if row else dict.fromkeys(COUNTER_FIELDS, 0)
+
+    def increment_many(self, deltas):
+        for _, field in deltas:
+            if field not in COUNTER_FIELDS:
+                raise ValueError(f"Unknown counter field: {field!r}")
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                for field in COUNTER_FIELDS:
+                    rows = [(amount, post_id) for (post_id, f), amount in deltas.items() if f == field]
+                    if rows:
+                        self._conn.executemany(f"UPDATE posts SET {field} = {field} + ? WHERE id = ?", rows)
+
+    def add_comment(self, post_id, body, created_at=None):
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute(
+                    "INSERT INTO comments (post_id, body, created_at) VALUES (?, ?, ?)",
+                    (post_id, body, created_at or time.time()),
+                )
+                self._conn.execute("UPDATE posts SET comment_count = comment_count + 1 WHERE id = ?", (post_id,))
+
+    def list_comments(self, post_id, limit=50):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT body FROM comments WHERE post_id = ? ORDER BY created_at DESC, id DESC LIMIT ?",
+                (post_id, limit),
+            ).fetchall()
+        return [row["body"] for row in reversed(rows)]
@@ -0,0 +1,167 @@
+"""Opt-in render profiling of the pages' hot sections.
+
+Wrap a section with ``section(name)``, as a ``with`` block or a decorator.
+While profiling is active it records wall time and, through ``tracemalloc``,
+net and peak Python allocations. Otherwise it costs about a microsecond.
+
+Profiling is active for every rerun when ``SWIPESCAPES_PROFILE=1`` is set.
+With ``SWIPESCAPES_PROFILE_PANEL=1`` it is instead active for reruns of a page
+opened with ``?profile=1``, which also shows the ``render_panel`` sidebar
+panel; without that server-side setting the query parameter is ignored, so
+visitors can't switch profiling on. Each section and each rerun is logged as
+one JSON line on the ``profiling`` logger. Sections running outside a rerun,
+such as photo prefetching on a worker thread, are only logged.
+
+``tracemalloc`` is process-wide: allocation figures include whatever other
+threads allocate (or free) meanwhile, and while it runs it slows every
+allocation. In panel mode it is stopped again as soon as no profiled rerun is
+running. Profiled reruns are tracked by script thread: Streamlit starts a new
+thread for the rerun that interrupts one (or follows an exception), so a rerun
+that never reaches ``render_panel`` is over once its thread has exited.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+LOG_ALL = os.environ.get("SWIPESCAPES_PROFILE", "") not in ("", "0")
+PANEL = os.environ.get("SWIPESCAPES_PROFILE_PANEL", "") not in ("", "0")
+QUERY_PARAM = "profile"
+
+logger = logging.getLogger(__name__)
+if (LOG_ALL or PANEL) and not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+_local = threading.local()
+_profiled_threads = set()  # script threads with a profiled rerun in progress, in panel mode
+_reruns_lock = threading.Lock()
+
+
+def _log(event, **fields):
+    logger.info(json.dumps({"event": event, "ts": round(time.time(), 3), **fields}))
+
+
+def active():
+    return getattr(_local, "active", False) or LOG_ALL
+
+
+def begin_rerun(page):
+    """Start collecting sections for this script run; call once near the top of a page."""
+    import streamlit as st
+
+    # A profiled rerun that never reached render_panel (st.rerun, an interrupt, an exception) ends here
+    _end_rerun()
+    _local.page = page
+    _local.panel = PANEL and st.query_params.get(QUERY_PARAM) == "1"
+    _local.active = _local.panel or LOG_ALL
+    _local.records = []
+    _local.stack = []
+    _local.started = time.perf_counter()
+    if _local.panel and not LOG_ALL:
+        with _reruns_lock:
+            _profiled_threads.add(threading.current_thread())
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+    elif _local.active and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def _end_rerun():
+    """End this thread's profiled rerun and those of exited threads; stop tracemalloc after the last (panel mode)."""
+    current = threading.current_thread()
+    with _reruns_lock:
+        if current in _profiled_threads:
+            # Fragment reruns skip begin_rerun; they must not inherit this rerun's profiling
+            _local.active = False
+        _profiled_threads.difference_update([thread for thread in _profiled_threads
+                                             if thread is current or not thread.is_alive()])
+        if not _profiled_threads and not LOG_ALL and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+@contextmanager
+def section(name):
+    """Time (and measure allocations of) the enclosed block while profiling is active."""
+    if not active():
+        yield
+        return
+    if LOG_ALL and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    stack = _local.__dict__.setdefault("stack", [])
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # The parent's peak so far would be lost by the reset below
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    tracemalloc.reset_peak()
+    frame = {"start": current, "peak": current}
+    stack.append(frame)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stack.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(frame["peak"], peak)
+        if stack:
+            stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+        record = {
+            "section": name,
+            "ms": round(elapsed_ms, 3),
+            "alloc_kb": round((current - frame["start"]) / 1024, 1),
+            "peak_kb": round((peak - frame["start"]) / 1024, 1),
+        }
+        records = getattr(_local, "records", None)
+        if records is not None:
+            records.append(record)
+        _log("section", page=getattr(_local, "page", None), thread=threading.current_thread().name, **record)
+
+
+def summary(records):
+    """Records grouped by section name: calls, total ms, net and peak KB (slowest first)."""
+    grouped = {}
+    for record in records:
+        row = grouped.setdefault(record["section"], {"section": record["section"], "calls": 0, "ms": 0.0,
+                                                     "alloc_kb": 0.0, "peak_kb": 0.0})
+        row["calls"] += 1
+        row["ms"] += record["ms"]
+        row["alloc_kb"] += record["alloc_kb"]
+        row["peak_kb"] = max(row["peak_kb"], record["peak_kb"])
+    for row in grouped.values():
+        row["ms"], row["alloc_kb"] = round(row["ms"], 3), round(row["alloc_kb"], 1)
+    return sorted(grouped.values(), key=lambda row: -row["ms"])
+
+
+def render_panel():
+    """Log this rerun and, if it was opened with ``?profile=1``, show its sections in the sidebar."""
+    profiled = getattr(_local, "active", False) or LOG_ALL
+    records = getattr(_local, "records", [])
+    rerun_ms = (time.perf_counter() - getattr(_local, "started", time.perf_counter())) * 1000
+    _end_rerun()
+    if not profiled:
+        return
+    rows = summary(records)
+    _log("rerun", page=getattr(_local, "page", None), ms=round(rerun_ms, 3), sections=rows)
+    if not getattr(_local, "panel", False):
+        return
+
+    import streamlit as st
+
+    with st.sidebar.expander("⏱️ Render profile", expanded=True):
+        st.caption(f"This rerun: {rerun_ms:.0f} ms up to the panel · Python allocations via tracemalloc")
+        if not rows:
+            st.write("No profiled sections ran.")
+            return
+        # A markdown table keeps the panel itself from pulling in pandas/pyarrow
+        lines = ["| Section | Calls | ms | Net KB | Peak KB |", "|---|---:|---:|---:|---:|"]
+        lines += [f"| {row['section']} | {row['calls']} | {row['ms']:.1f} | {row['alloc_kb']:,.0f} | {row['peak_kb']:,.0f} |"
+                  for row in rows]
+        st.markdown("\n".join(lines))
+        st.caption("Background work such as photo prefetching is only written to the log.")
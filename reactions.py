@@ -0,0 +1,86 @@
+"""Write-behind buffer for community feed reactions.
+
+Clicks are added to an in-memory counter and flushed to the post store in one
+transaction per batch, when enough clicks are pending or on a timer, instead of
+one write per click. Cards read stored counts plus pending deltas, so a click
+shows up immediately even before it has been flushed.
+"""
+import atexit
+import threading
+from collections import Counter
+
+from post_store import COUNTER_FIELDS
+
+
+class ReactionBuffer:
+    """Process-wide buffer of pending ``(post_id, field)`` counter increments."""
+
+    def __init__(self, store, max_pending=500, flush_interval=2.0):
+        self.store = store
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = Counter()
+        self._in_flight = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._flush_periodically, name="reaction-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, post_id, field, amount=1):
+        """Count one reaction; flushes inline once ``max_pending`` clicks are buffered."""
+        if field not in COUNTER_FIELDS:
+            raise ValueError(f"Unknown counter field: {field!r}")
+        with self._lock:
+            self._pending[(post_id, field)] += amount
+            full = sum(self._pending.values()) >= self.max_pending
+        if full:
+            self.flush()
+
+    def pending_for(self, post_id):
+        """Deltas for ``post_id`` not yet committed to the store, keyed by field."""
+        with self._lock:
+            return {
+                field: self._pending[(post_id, field)] + self._in_flight[(post_id, field)]
+                for field in COUNTER_FIELDS
+            }
+
+    def counts(self, post_id):
+        """Stored counts of ``post_id`` with pending deltas applied."""
+        # Read pending first: a flush that commits in between can only over-count
+        # briefly, never drop a click from the display
+        pending = self.pending_for(post_id)
+        stored = self.store.get_counts(post_id)
+        return {field: stored[field] + pending[field] for field in COUNTER_FIELDS}
+
+    def flush(self):
+        """Write every pending delta to the store in one batch."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, Counter()
+                self._in_flight = batch
+            try:
+                self.store.increment_many(dict(batch))
+            except Exception:
+                # Keep the clicks; they are retried with the next batch
+                with self._lock:
+                    self._pending.update(batch)
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight = Counter()
+
+    def close(self):
+        """Stop the timer thread and flush what is left."""
+        self._stopped.set()
+        self.flush()
+
+    def _flush_periodically(self):
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass
@@ -0,0 +1,219 @@
+"""Typed catalog records shared by every app.
+
+Catalog entries (attractions, restaurants, flights, destinations, posts) are
+frozen, slotted dataclasses built once when a catalog is loaded. Display
+strings such as ``"7h 15m"``, ``"2%"`` or ``"INR 15000"`` are parsed into
+numbers at that point and validated, so pages never re-parse them on a rerun.
+Slotted records also take far less memory than the equivalent dicts.
+
+``RecordTable`` wraps a sequence of records and builds NumPy columns on first
+use, for the vectorized searches, schedulers and recommenders.
+"""
+import re
+from dataclasses import dataclass
+
+DELAY_LEVELS = {"Low": 0, "Medium": 1, "High": 2}
+PRICE_LEVELS = {"€": 1, "€€": 2, "€€€": 3}
+_DURATION = re.compile(r"(?:(\d+)\s*h)?\s*(?:(\d+)\s*m)?")
+_INR = re.compile(r"(?:INR|₹)\s*([\d,]+)")
+_CLOCK = re.compile(r"(?:\d{4}-\d{2}-\d{2}[ T])?(\d{1,2}):(\d{2})")
+_DAYS = re.compile(r"~?\s*(\d+)(?:\s*-\s*(\d+))?\s*(?:\w+\s+)?days?")
+
+
+# --- Parsing ---
+def parse_duration(text):
+    """Minutes in a ``"7h 15m"``-style duration."""
+    match = _DURATION.fullmatch(text.strip())
+    if not match or not any(match.groups()):
+        raise ValueError(f"Unrecognised duration: {text!r}")
+    hours, minutes = (int(part or 0) for part in match.groups())
+    return hours * 60 + minutes
+
+
+def format_duration(minutes):
+    return f"{minutes // 60}h {minutes % 60}m"
+
+
+def parse_percent(text):
+    """``"2%"`` -> ``0.02``."""
+    return float(str(text).rstrip("% ")) / 100
+
+
+def format_percent(fraction):
+    return f"{fraction * 100:g}%"
+
+
+def parse_inr(text):
+    """``"INR 15000"`` (or ``"₹15,000"``) -> ``15000``."""
+    match = _INR.fullmatch(str(text).strip())
+    if not match:
+        raise ValueError(f"Unrecognised INR amount: {text!r}")
+    return int(match.group(1).replace(",", ""))
+
+
+def parse_clock_minutes(text):
+    """Minutes after midnight of ``"HH:MM"`` or ``"YYYY-MM-DD HH:MM"``."""
+    match = _CLOCK.fullmatch(text.strip())
+    if not match:
+        raise ValueError(f"Unrecognised time: {text!r}")
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def parse_days(text):
+    """Upper bound of ``"~10-15 working days"`` (``"-"`` -> ``0``)."""
+    text = str(text).strip()
+    if text in ("", "-"):
+        return 0
+    match = _DAYS.fullmatch(text)
+    if not match:
+        raise ValueError(f"Unrecognised number of days: {text!r}")
+    return int(match.group(2) or match.group(1))
+
+
+def _check_coordinates(name, lat, lon):
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError(f"{name}: coordinates out of range ({lat}, {lon})")
+
+
+# --- Records ---
+@dataclass(frozen=True, slots=True)
+class Attraction:
+    name: str
+    lat: float
+    lon: float
+    duration: int
+    category: str
+
+    @classmethod
+    def from_dict(cls, name, data):
+        _check_coordinates(name, data["lat"], data["lon"])
+        return cls(name, float(data["lat"]), float(data["lon"]), int(data["duration"]), data["category"])
+
+
+@dataclass(frozen=True, slots=True)
+class Restaurant:
+    name: str
+    lat: float
+    lon: float
+    cuisine: str
+    price: str
+    stars: int
+    price_level: int
+
+    @classmethod
+    def from_dict(cls, name, data):
+        _check_coordinates(name, data["lat"], data["lon"])
+        price = data["price"]
+        return cls(name, float(data["lat"]), float(data["lon"]), data["cuisine"], price, int(data["stars"]),
+                   PRICE_LEVELS.get(price, len(price)))
+
+
+@dataclass(frozen=True, slots=True)
+class Flight:
+    carrier: str
+    departure: str
+    arrival: str
+    return_dep: str
+    return_arr: str
+    dep_minute: int
+    duration_min: int
+    cost: int
+    cancellation: float
+    delays: str
+    delay_level: int
+    audience: str
+    rating: int
+
+    @classmethod
+    def from_dict(cls, data):
+        if data["delays"] not in DELAY_LEVELS:
+            raise ValueError(f"{data['carrier']}: unknown delay risk {data['delays']!r}")
+        return cls(
+            data["carrier"], data["departure"], data["arrival"], data["return_dep"], data["return_arr"],
+            parse_clock_minutes(data["departure"]), parse_duration(data["duration"]), int(data["cost"]),
+            parse_percent(data["cancellation"]), data["delays"], DELAY_LEVELS[data["delays"]],
+            data.get("audience", ""), int(data.get("rating", 0)),
+        )
+
+    @property
+    def duration(self):
+        return format_duration(self.duration_min)
+
+    @property
+    def cancellation_label(self):
+        return format_percent(self.cancellation)
+
+
+@dataclass(frozen=True, slots=True)
+class Destination:
+    name: str
+    lat: float
+    lon: float
+    country: str
+    visa: str
+    visa_time: str
+    visa_days: int
+    funds: str
+    known_for: str
+    cost_inr: int
+    safety: int
+    icon: str
+
+    @classmethod
+    def from_dict(cls, data):
+        """From the ``locations`` entries of the where-to-go page."""
+        _check_coordinates(data["Destination"], data["Lat"], data["Lon"])
+        return cls(
+            data["Destination"], float(data["Lat"]), float(data["Lon"]), data["Country"], data["Visa"],
+            data["Visa_time"], parse_days(data["Visa_time"]), data["Funds"], data["Known_for"],
+            parse_inr(data["Cost"]), int(data["Safety"]), data["Icon"],
+        )
+
+    @property
+    def cost_label(self):
+        return f"INR {self.cost_inr}"
+
+
+@dataclass(frozen=True, slots=True)
+class Post:
+    id: int
+    destination: str
+    user: str
+    content: str
+    type: str
+    likes: int
+    useful: int
+    not_useful: int
+    comment_count: int
+    created_at: float
+
+
+# --- Columnar views ---
+class RecordTable:
+    """Records plus NumPy columns built on first use and then reused."""
+
+    __slots__ = ("records", "_columns")
+
+    def __init__(self, records):
+        self.records = tuple(records)
+        self._columns = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, position):
+        return self.records[position]
+
+    def column(self, field, dtype=None):
+        """Array of one field across all records (read-only, shared)."""
+        column = self._columns.get((field, dtype))
+        if column is None:
+            import numpy as np
+
+            column = np.array([getattr(record, field) for record in self.records], dtype=dtype)
+            column.flags.writeable = False
+            self._columns[(field, dtype)] = column
+        return column
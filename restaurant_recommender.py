@@ -0,0 +1,113 @@
+"""Meal-gap detection and nearest-restaurant recommendations for itinerary days.
+
+Restaurants are indexed once as unit vectors on the sphere, so ranking the whole
+catalog by great-circle distance from the stops around a meal gap is a single
+matrix-vector product plus ``argpartition``; that stays in the millisecond range
+for catalogs of tens of thousands of restaurants.
+"""
+import numpy as np
+
+from geo import EARTH_RADIUS_KM, unit_vectors
+from itinerary_scheduler import to_minutes
+from records import PRICE_LEVELS, RecordTable
+
+MEAL_WINDOWS = {"Lunch": ("12:00", "14:30"), "Dinner": ("18:30", "21:30")}
+DEFAULT_MEALS = ("Lunch",)
+
+
+class RestaurantIndex:
+    """Column arrays over ``{name: records.Restaurant}`` for vectorized lookups."""
+
+    def __init__(self, restaurants):
+        table = RecordTable(restaurants.values())
+        self.names = table.column("name", dtype=object)
+        self.xyz = unit_vectors(table.column("lat"), table.column("lon"))
+        self.cuisine = table.column("cuisine", dtype=object)
+        self.price = table.column("price", dtype=object)
+        self.price_level = table.column("price_level", dtype=np.int8)
+        self.stars = table.column("stars", dtype=np.int8)
+
+    @property
+    def cuisines(self):
+        return sorted(set(self.cuisine))
+
+    def nearest(self, anchors, k=5, cuisines=None, max_price=None, min_stars=None, exclude=()):
+        """Top ``k`` restaurants by total distance (km) from the ``(lat, lon)`` anchors."""
+        mask = np.ones(len(self.names), dtype=bool)
+        if exclude:
+            mask &= ~np.isin(self.names, list(exclude))
+        if cuisines:
+            mask &= np.isin(self.cuisine, list(cuisines))
+        if max_price is not None:
+            mask &= self.price_level <= PRICE_LEVELS.get(max_price, max_price)
+        if min_stars is not None:
+            mask &= self.stars >= min_stars
+        candidates = np.flatnonzero(mask)
+        if not len(candidates) or not anchors:
+            return []
+
+        anchor_xyz = unit_vectors([a[0] for a in anchors], [a[1] for a in anchors])
+        cos_angles = np.clip(self.xyz[candidates] @ anchor_xyz.T, -1.0, 1.0)
+        distance = (np.arccos(cos_angles) * EARTH_RADIUS_KM).sum(axis=1)
+
+        k = min(k, len(candidates))
+        top = np.argpartition(distance, k - 1)[:k]
+        top = top[np.argsort(distance[top])]
+        return [
+            {
+                "name": self.names[i],
+                "cuisine": self.cuisine[i],
+                "price": self.price[i],
+                "stars": int(self.stars[i]),
+                "distance_km": float(distance[j]),
+            }
+            for i, j in zip(candidates[top], top)
+        ]
+
+
+def find_meal_gaps(day_name, day, schedule, meal_windows=MEAL_WINDOWS):
+    """Meals listed for the day (``day["meals"]``) with no restaurant stop in their window.
+
+    Each gap records where a restaurant would be inserted and the neighbouring
+    stops used as anchors for ranking.
+    """
+    gaps = []
+    for meal in day.get("meals", DEFAULT_MEALS):
+        window_start, window_end = (to_minutes(t) for t in meal_windows[meal])
+        covered = any(
+            row["type"] == "restaurant"
+            and to_minutes(row["start"]) < window_end
+            and to_minutes(row["end"]) > window_start
+            for row in schedule
+        )
+        if covered:
+            continue
+        # Insert before the first stop still running when the meal window opens
+        position = next(
+            (i for i, row in enumerate(schedule) if to_minutes(row["end"]) > window_start), len(schedule)
+        )
+        gaps.append({
+            "day": day_name,
+            "meal": meal,
+            "position": position,
+            "not_before": meal_windows[meal][0],
+            "anchors": [schedule[i]["name"] for i in (position - 1, position) if 0 <= i < len(schedule)],
+        })
+    return gaps
+
+
+def apply_meal_choices(itinerary, gaps, choices):
+    """Copy of ``itinerary`` with the chosen restaurant inserted into each filled gap.
+
+    ``choices`` maps ``(day, meal)`` to a restaurant name (or ``None``).
+    """
+    planned = {day_name: {**day, "stops": list(day["stops"])} for day_name, day in itinerary.items()}
+    # Later positions first, so earlier insertions do not shift them
+    for gap in sorted(gaps, key=lambda g: g["position"], reverse=True):
+        name = choices.get((gap["day"], gap["meal"]))
+        if name:
+            planned[gap["day"]]["stops"].insert(
+                gap["position"],
+                {"name": name, "type": "restaurant", "not_before": gap["not_before"], "meal": gap["meal"]},
+            )
+    return planned
@@ -0,0 +1,124 @@
+"""Minified, content-hashed stylesheets and pages served by Streamlit's static file serving.
+
+Page CSS lives in ``assets/<name>.css``. ``stylesheet(name)`` minifies it into
+``static/<name>.<hash>.css`` (built on first use and again whenever the source
+changes) and returns a ``<link>`` tag for it. ``server.enableStaticServing`` in
+``.streamlit/config.toml`` serves ``static/`` at ``app/static/``. A rerun then
+sends a ~100 byte tag instead of the whole stylesheet over the websocket.
+Browsers fetch each version once and revalidate it by ETag. The name changes
+with the content, so a long-lived cached copy is never stale.
+
+The tag is still sent on every rerun rather than once per session: Streamlit
+removes any element a rerun doesn't draw again, so a stylesheet injected only
+on the first run would be gone after the second.
+
+Fonts are self-hosted: each ``static/fonts/<Family>-<weight>.woff2`` gets an
+``@font-face`` rule (``font-display: swap``, so text never waits for it) in
+every stylesheet that names the family. Nothing is loaded from third-party
+font servers. Poppins ships in the weights the pages use (300, 400, 600,
+700), subset to Latin, under the SIL Open Font License (``Poppins-OFL.txt``).
+
+Large generated HTML (e.g. the where-to-go map) goes the same way through
+``publish``, so an iframe rerun sends a URL instead of the whole document.
+"""
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+ASSETS_DIR = ROOT / "assets"
+STATIC_DIR = ROOT / "static"
+FONTS_DIR = STATIC_DIR / "fonts"
+STATIC_URL = "/app/static"
+_FONT_FILE = re.compile(r"^(?P<family>[A-Za-z ]+)-(?P<weight>\d00)(?P<italic>italic)?$")
+
+_built = {}  # name -> (source mtime, hashed file name)
+_lock = threading.Lock()
+
+
+def minify_css(css):
+    """Drop comments and insignificant whitespace."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r"([{;])\s*([\w-]+)\s*:\s*", r"\1\2:", css)
+    return css.replace(";}", "}").strip()
+
+
+def font_faces(css):
+    """``@font-face`` rules for the self-hosted fonts ``css`` refers to."""
+    rules = []
+    for path in sorted(FONTS_DIR.glob("*.woff2")):
+        match = _FONT_FILE.match(path.stem)
+        if match and match["family"] in css:
+            rules.append(
+                f"@font-face {{ font-family: '{match['family']}'; font-weight: {match['weight']}; "
+                f"font-style: {'italic' if match['italic'] else 'normal'}; font-display: swap; "
+                f"src: url(fonts/{path.name}) format('woff2'); }}"
+            )
+    return "\n".join(rules)
+
+
+def write_hashed(name, data, suffix, keep=1):
+    """Write ``data`` (bytes) to ``static/<name>.<hash><suffix>``; returns the file name.
+
+    Only the ``keep`` most recently written versions of ``name`` are kept.
+    """
+    filename = f"{name}.{hashlib.sha256(data).hexdigest()[:10]}{suffix}"
+    target = STATIC_DIR / filename
+    STATIC_DIR.mkdir(exist_ok=True)
+    if target.exists():
+        target.touch()
+    else:
+        partial = target.with_name(f"{filename}.{threading.get_ident()}.tmp")
+        partial.write_bytes(data)
+        partial.replace(target)
+    pattern = re.compile(rf"{re.escape(name)}\.[0-9a-f]{{10}}{re.escape(suffix)}")
+    versions = sorted((path for path in STATIC_DIR.glob(f"{name}.*{suffix}") if pattern.fullmatch(path.name)),
+                      key=lambda path: path.stat().st_mtime_ns, reverse=True)
+    for old in versions[keep:]:
+        if old.name != filename:
+            old.unlink(missing_ok=True)
+    return filename
+
+
+def build(name):
+    """Write the minified ``static/<name>.<hash>.css`` for ``assets/<name>.css``; returns its file name."""
+    source = (ASSETS_DIR / f"{name}.css").read_text(encoding="utf-8")
+    return write_hashed(name, minify_css(font_faces(source) + "\n" + source).encode("utf-8"), ".css")
+
+
+def stylesheet(name):
+    """``<link>`` tag for the built ``assets/<name>.css``, for ``st.markdown(..., unsafe_allow_html=True)``."""
+    mtime = (ASSETS_DIR / f"{name}.css").stat().st_mtime_ns
+    with _lock:
+        built = _built.get(name)
+        if built is None or built[0] != mtime:
+            built = _built[name] = (mtime, build(name))
+    return f'<link rel="stylesheet" href="{STATIC_URL}/{built[1]}">'
+
+
+def publish(name, html, keep=16):
+    """Serve ``html`` as ``static/<name>.<hash>.html``; returns its URL (for ``st.iframe``).
+
+    Only the ``keep`` most recently published or ``touch``-ed versions are kept,
+    so callers that cache the URL must ``touch`` it whenever they hand it out.
+    """
+    return f"{STATIC_URL}/{write_hashed(name, html.encode('utf-8'), '.html', keep)}"
+
+
+def touch(url):
+    """Mark a ``publish``-ed URL as in use, so pruning keeps it; ``False`` when its file is gone."""
+    try:
+        os.utime(STATIC_DIR / url.rpartition("/")[2])
+    except FileNotFoundError:
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    for path in sorted(ASSETS_DIR.glob("*.css")):
+        filename = build(path.stem)
+        print(f"{path.name}: {path.stat().st_size:,} B -> static/{filename}: {(STATIC_DIR / filename).stat().st_size:,} B")
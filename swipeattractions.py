@@ -1,14 +1,17 @@
 import streamlit as st
 from pathlib import Path
-from PIL import Image
+from image_cache import PhotoPrefetcher
+import profiling
 
 # --- Page Setup ---
 st.set_page_config(page_title="SwipeScapes - Paris", layout="wide")
+profiling.begin_rerun("swipe:paris")
 st.title("🇫🇷 SwipeScapes - Discover Paris Attractions")
 
 # --- Constants ---
 PARIS = "Paris"
 IMAGES_PATH = Path("images")  # Folder containing your image files
+PREFETCH_CARDS = 3  # Upcoming cards whose photos are staged in the background
 
 # --- Attraction Data ---
 destinations = {
@@ -61,6 +64,8 @@ if "photo_index" not in st.session_state:
     st.session_state.photo_index = {PARIS: 0}
 if "finalized" not in st.session_state:
     st.session_state.finalized = False
+if "prefetcher" not in st.session_state:
+    st.session_state.prefetcher = PhotoPrefetcher(display_width=450)
 
 # --- Helper Functions ---
 def move_next(city, place_name=None):
@@ -107,6 +112,12 @@ else:
     if st.session_state.indices[city] >= len(filtered):
         st.success("🎉 You've swiped through all available attractions in Paris!")
     else:
+        # Stage photos for the current card and the next few; evict cards already swiped past
+        upcoming = filtered[st.session_state.indices[city]:st.session_state.indices[city] + 1 + PREFETCH_CARDS]
+        upcoming_photos = [photo for card in upcoming for photo in card["photos"]]
+        st.session_state.prefetcher.retain(upcoming_photos)
+        st.session_state.prefetcher.prefetch(upcoming_photos)
+
         place = filtered[st.session_state.indices[city]]
         current_attraction_index = st.session_state.indices[city]
         current_photo_index = st.session_state.photo_index[city]
@@ -118,12 +129,9 @@ else:
 
             if current_photo_path.exists():
                 try:
-                    img = Image.open(current_photo_path)
-                    # Resize image to larger display size
-                    max_width = 1200
-                    if img.width > max_width:
-                        new_height = int((max_width / img.width) * img.height)
-                        img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
+                    # Pre-sized derivative, usually already staged by the prefetcher
+                    with profiling.section("photo load"):
+                        img = st.session_state.prefetcher.get(current_photo_path)
 
                     st.image(
                         img,
@@ -210,3 +218,5 @@ if st.session_state.finalized:
         **[⬅️ Return to Main Trip Planning Page](https://your-main-website.com)**
         """
     )
+
+profiling.render_panel()
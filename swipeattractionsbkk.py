@@ -1,9 +1,11 @@
 import streamlit as st
 import time
 from pathlib import Path
-from PIL import Image
+from image_cache import PhotoPrefetcher
+import profiling
 
 st.set_page_config(page_title="SwipeScapes - Bangkok", layout="wide")
+profiling.begin_rerun("swipe:bangkok")
 st.title("🇹🇭 SwipeScapes - Discover Bangkok Attractions")
 
 BANGKOK = "Bangkok"
@@ -11,6 +13,7 @@ BANGKOK = "Bangkok"
 # --- Path to local images folder ---
 # Update this path to match your local folder structure
 IMAGES_PATH = Path("images")  # e.g., "images/bangkok" or "/Users/yourname/Desktop/bangkok_images"
+PREFETCH_CARDS = 3  # Upcoming cards whose photos are staged in the background
 
 # --- Attraction Data with local image paths ---
 destinations = {
@@ -75,6 +78,8 @@ if "photo_index" not in st.session_state:
     st.session_state.photo_index = {BANGKOK: 0}
 if "finalized" not in st.session_state:
     st.session_state.finalized = False
+if "prefetcher" not in st.session_state:
+    st.session_state.prefetcher = PhotoPrefetcher(display_width=450)
 
 
 # --- Callbacks for state updates ---
@@ -123,6 +128,12 @@ else:
     if st.session_state.indices[city] >= len(filtered):
         st.success("🎉 You've swiped through all available attractions in Bangkok!")
     else:
+        # Stage photos for the current card and the next few; evict cards already swiped past
+        upcoming = filtered[st.session_state.indices[city]:st.session_state.indices[city] + 1 + PREFETCH_CARDS]
+        upcoming_photos = [photo for card in upcoming for photo in card["photos"]]
+        st.session_state.prefetcher.retain(upcoming_photos)
+        st.session_state.prefetcher.prefetch(upcoming_photos)
+
         place = filtered[st.session_state.indices[city]]
         current_attraction_index = st.session_state.indices[city]
         current_photo_index = st.session_state.photo_index[city]
@@ -136,12 +147,9 @@ else:
             # Check if image file exists
             if current_photo_path.exists():
                 try:
-                    img = Image.open(current_photo_path)
-                    # Resize image if too large
-                    max_width = 1200
-                    if img.width > max_width:
-                        new_height = int((max_width / img.width) * img.height)
-                        img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
+                    # Load pre-sized derivative (staged in the background by the prefetcher)
+                    with profiling.section("photo load"):
+                        img = st.session_state.prefetcher.get(current_photo_path)
                     
                     st.image(
                         img,
@@ -223,3 +231,5 @@ if st.session_state.finalized:
         **[⬅️ Click here to return to your main trip planning page](https://your-main-website.com)**
         """
     )
+
+profiling.render_panel()
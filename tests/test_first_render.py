@@ -0,0 +1,39 @@
+"""Time to first render of the community feed.
+
+Fails if the first run of the script is not well under a second, e.g. if the
+travel reminder ever goes back to sleeping on the script thread. Run from the
+repository root:
+
+    python -m pytest tests
+"""
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import community_feed  # noqa: E402
+
+APP = ROOT / "community.py"
+BUDGET_SECONDS = 1.0
+
+
+def test_community_first_render_within_budget(tmp_path, monkeypatch):
+    # A scratch post store, never the real community.db
+    monkeypatch.setenv("SWIPESCAPES_COMMUNITY_DB", str(tmp_path / "community.db"))
+    monkeypatch.setattr(community_feed, "DB_PATH", str(tmp_path / "community.db"))
+    community_feed.get_post_store.clear()
+    community_feed.get_reaction_buffer.clear()
+
+    at = AppTest.from_file(str(APP), default_timeout=30)
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+
+    assert not at.exception, at.exception[0].message
+    assert any("days left for your trip" in m.value for m in at.markdown)
+    assert (tmp_path / "community.db").exists()
+    assert elapsed < BUDGET_SECONDS, f"first render took {elapsed * 1000:.0f} ms (budget {BUDGET_SECONDS * 1000:.0f} ms)"
@@ -0,0 +1,193 @@
+"""Local map tile server for MBTiles bundles, so maps don't depend on public tile servers.
+
+Run it next to the apps with one ``name=path`` per tileset:
+
+    python tile_server.py osm=osm.mbtiles light-gray=light_gray.mbtiles --port 8600
+
+and set ``SWIPESCAPES_TILE_SERVER`` to the base URL the *browser* reaches it at
+(e.g. ``http://localhost:8600``). ``map_tiles`` then points each app's
+``folium.Map`` at ``<base>/<tileset>/{z}/{x}/{y}``: the itinerary maps use
+``osm`` and the where-to-go map ``light-gray``. Without the variable the maps
+keep their public providers.
+
+Tiles are answered with ``Cache-Control`` and an ``ETag`` (a revalidation
+gets ``304``), and the hottest ones are kept in memory in a ``TileCache``.
+Tiles missing from a bundle get ``204`` so Leaflet leaves them blank;
+coordinates outside the tile grid (zoom above ``MAX_ZOOM``) get ``400``.
+Folium maps need raster (png/jpg/webp) bundles; vector (pbf) bundles are
+served too, for vector-capable clients. PMTiles archives are not supported
+(there is no PMTiles reader in this deployment); convert them to MBTiles.
+Standard library only.
+"""
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+TILE_SERVER = os.environ.get("SWIPESCAPES_TILE_SERVER", "").rstrip("/")
+DEFAULT_PORT = 8600
+MAX_AGE = 7 * 24 * 3600  # seconds browsers may reuse a tile without asking
+CACHE_MB = 64
+MAX_ZOOM = 30  # deepest zoom level accepted in a tile URL
+CONTENT_TYPES = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg", "webp": "image/webp",
+                 "pbf": "application/x-protobuf"}
+_TILE_PATH = re.compile(r"^/([\w.-]+)/(\d+)/(\d+)/(\d+)(?:\.\w+)?$")
+
+
+def map_tiles(tileset, tiles, attr=None):
+    """``(tiles, attr)`` for ``folium.Map``: the local ``tileset`` when a tile server is configured."""
+    if TILE_SERVER:
+        return f"{TILE_SERVER}/{tileset}/{{z}}/{{x}}/{{y}}", attr
+    return tiles, attr
+
+
+class MBTiles:
+    """Read-only MBTiles bundle (SQLite, TMS row order), one connection per thread."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        if self.path.suffix.lower() == ".pmtiles":
+            raise ValueError(f"{self.path}: PMTiles archives are not supported, convert them to MBTiles")
+        if not self.path.is_file():
+            raise FileNotFoundError(self.path)
+        self._local = threading.local()
+        self.metadata = dict(self._connection().execute("SELECT name, value FROM metadata").fetchall())
+        self.format = self.metadata.get("format", "png").lower()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        return conn
+
+    def tile(self, z, x, y):
+        """Tile bytes for XYZ coordinates, or ``None``."""
+        row = self._connection().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            (z, x, (1 << z) - 1 - y),
+        ).fetchone()
+        return row[0] if row else None
+
+
+class TileCache:
+    """Least-recently-used tiles up to ``max_bytes``, as ``(data, etag)``. Thread-safe.
+
+    Misses (tiles not in the bundle) are not cached, so requests for arbitrary
+    coordinates can't grow the cache past its size.
+    """
+
+    def __init__(self, max_bytes=CACHE_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, load):
+        """Cached entry for ``key``, else ``load()`` turned into ``(data, etag)`` (``(None, None)`` for a miss)."""
+        with self._lock:
+            entry = self._tiles.get(key)
+            if entry is not None:
+                self._tiles.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        data = load()
+        if data is None:
+            return None, None
+        entry = (data, f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"')
+        with self._lock:
+            if key not in self._tiles:
+                self._tiles[key] = entry
+                self.size += len(data)
+            while self.size > self.max_bytes and self._tiles:
+                old, _ = self._tiles.popitem(last=False)[1]
+                self.size -= len(old)
+        return entry
+
+
+class TileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, browsers fetch many tiles per view
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't hold the body back
+
+    def do_GET(self):
+        match = _TILE_PATH.match(self.path.split("?", 1)[0])
+        bundle = match and self.server.bundles.get(match.group(1))
+        if not bundle:
+            self._respond(404, cache=False)
+            return
+        z, x, y = (int(part) for part in match.groups()[1:])
+        if z > MAX_ZOOM or x >= 1 << z or y >= 1 << z:
+            self._respond(400, cache=False)
+            return
+        data, etag = self.server.cache.get((match.group(1), z, x, y), lambda: bundle.tile(z, x, y))
+        if data is None:
+            self._respond(204)
+        elif etag in self.headers.get("If-None-Match", ""):
+            self._respond(304, etag=etag)
+        else:
+            self._respond(200, data, bundle.format, etag)
+
+    def _respond(self, status, body=b"", fmt=None, etag=None, cache=True):
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", f"public, max-age={self.server.max_age}" if cache else "no-store")
+        if etag:
+            self.send_header("ETag", etag)
+        if fmt:
+            self.send_header("Content-Type", CONTENT_TYPES.get(fmt, "application/octet-stream"))
+            if fmt == "pbf" and body[:2] == b"\x1f\x8b":
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # one line per tile would drown the console
+
+
+def make_server(bundles, host="127.0.0.1", port=DEFAULT_PORT, cache=None, max_age=MAX_AGE):
+    """HTTP server for ``{tileset: MBTiles}``; call ``serve_forever()`` on it (``port=0`` picks a free one)."""
+    server = ThreadingHTTPServer((host, port), TileHandler)
+    server.daemon_threads = True
+    server.bundles = bundles
+    server.cache = cache or TileCache()
+    server.max_age = max_age
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve MBTiles bundles as {tileset}/{z}/{x}/{y} map tiles.")
+    parser.add_argument("tilesets", nargs="+", metavar="NAME=PATH", help="e.g. osm=osm.mbtiles")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--cache-mb", type=int, default=CACHE_MB, help="in-memory tile cache size")
+    parser.add_argument("--max-age", type=int, default=MAX_AGE, help="Cache-Control max-age in seconds")
+    args = parser.parse_args()
+
+    bundles = {}
+    for spec in args.tilesets:
+        name, sep, path = spec.partition("=")
+        if not sep:
+            parser.error(f"expected NAME=PATH, got {spec!r}")
+        try:
+            bundles[name] = MBTiles(path)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            parser.error(str(exc))
+    server = make_server(bundles, args.host, args.port, TileCache(args.cache_mb * 1024 * 1024), args.max_age)
+    print(f"Serving {', '.join(bundles)} on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
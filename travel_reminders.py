@@ -0,0 +1,54 @@
+"""Travel reminder banners that never block the script thread.
+
+The banner fades itself out with a CSS animation in the browser, so the script
+renders the feed straight away instead of sleeping until the banner is gone.
+The server only keeps a per-session record of the destinations whose reminder
+has already been shown, so it is not repeated on later reruns.
+"""
+import streamlit as st
+from static_assets import stylesheet
+
+BANNER_SECONDS = 5
+
+TRIP_WEATHER = {
+    "Paris": {
+        "temp_range": "10°C to 18°C",
+        "packing": "light jacket, sweater, comfortable shoes, umbrella, and sunglasses",
+    },
+    "Bangkok": {
+        "temp_range": "28°C to 35°C",
+        "packing": "light cotton clothes, sandals, sunhat, sunscreen, and umbrella for showers",
+    },
+}
+
+BANNER_HTML = """
+<div class="popup-banner" style="--fade-out-at: {fade_out_at}s">
+    <div class="banner-content">
+        <h3>⏰ {days_left} days left for your trip to {destination}!</h3>
+        <p>🌤️ Expected Temperatures: <b>{temp_range}</b></p>
+        <p>🧳 Suggested Packing: {packing}</p>
+    </div>
+</div>
+"""
+
+
+def reminder_shown(destination):
+    """Whether this session has already seen the reminder for ``destination``."""
+    return destination in st.session_state.setdefault("reminders_shown", set())
+
+
+def mark_reminder_shown(destination):
+    """Record that this session has seen the reminder for ``destination``."""
+    st.session_state.setdefault("reminders_shown", set()).add(destination)
+
+
+def travel_reminder(destination, days_left):
+    """Show the pop-up banner once per session and destination without blocking the rerun."""
+    if reminder_shown(destination):
+        return
+
+    weather = TRIP_WEATHER[destination]
+    st.markdown(stylesheet("travel_reminders") + BANNER_HTML.format(destination=destination, days_left=days_left,
+                                                                    fade_out_at=BANNER_SECONDS - 0.5, **weather),
+                unsafe_allow_html=True)
+    mark_reminder_shown(destination)